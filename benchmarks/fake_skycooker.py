@@ -0,0 +1,399 @@
+#!/usr/local/bin/python3
+# coding: utf-8
+"""Симулятор мультиварки SkyCooker для бенчмарков и проверки транспорта без устройства.
+
+FakeSkyCookerDevice реализует UART сервис (UUID_TX/UUID_RX), весь набор команд
+из const.py и переходы статусов (ожидание -> отложенный старт -> разогрев ->
+готовка -> подогрев/выключение). FakeSkyCookerClient повторяет ту часть
+интерфейса BleakClientWithServiceCache, которой пользуется
+SkyCookerConnectionManager, и подключается через параметр client_factory:
+
+    device = FakeSkyCookerDevice("RMC-M40S", latency=0.03, jitter=0.01, drop_rate=0.01)
+    manager = SkyCookerConnectionManager(mac, key, model_name="RMC-M40S", client_factory=device.connect)
+"""
+
+import asyncio
+import logging
+import random
+import time
+from struct import pack, unpack
+from typing import Any, Callable, Dict, List, Optional
+
+from custom_components.skycooker.const import *
+from custom_components.skycooker.programs import get_program_constants, is_subprogram_supported
+from custom_components.skycooker.skycooker import SkyCooker
+
+_LOGGER = logging.getLogger(__name__)
+
+# Длина параметров SELECT_PROGRAM/SET_MAIN_MODE для моделей без подпрограмм и с ними
+SELECT_PROGRAM_LENGTH = {False: 1, True: 2}
+SET_MAIN_MODE_LENGTH = {False: 8, True: 9}
+
+# Длительность разогрева перед готовкой (секунды симуляции)
+DEFAULT_WARMING_TIME = 60
+
+
+class FakeSkyCookerDevice:
+    """Состояние и протокол симулируемой мультиварки.
+
+    Время берется из clock (по умолчанию время цикла событий), поэтому статус
+    вычисляется лениво и корректно продвигается и в реальном, и в виртуальном времени.
+    Задержка ответа равна latency плюс равномерный разброс до jitter, а каждый
+    ответ теряется с вероятностью drop_rate.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        key: Optional[bytes] = None,
+        version: str = "3.12",
+        latency: float = 0.03,
+        jitter: float = 0.0,
+        drop_rate: float = 0.0,
+        connect_latency: float = 0.5,
+        mtu: int = 20,
+        warming_time: float = DEFAULT_WARMING_TIME,
+        status_ack_commands: Optional[List[int]] = None,
+        push_status: bool = False,
+        pairing_mode: bool = True,
+        clock: Optional[Callable[[], float]] = None,
+        seed: Optional[int] = None,
+    ) -> None:
+        self.model_name = model_name
+        self.model_id = SkyCooker.get_model_id(model_name)
+        if self.model_id is None:
+            raise ValueError(f"Неизвестная модель {model_name}")
+        self.subprogram_supported = is_subprogram_supported(self.model_id)
+        self.program_constants = get_program_constants(self.model_id)
+        self.version = tuple(int(part) for part in version.split("."))
+        self.latency = latency
+        self.jitter = jitter
+        self.drop_rate = drop_rate
+        self.connect_latency = connect_latency
+        self.mtu = mtu
+        self.warming_time = warming_time
+        # Команды, на которые устройство отвечает кадром статуса 0x06 вместо подтверждения
+        self.status_ack_commands = set(status_ack_commands or [])
+        # Рассылать ли статус без запроса при каждом изменении
+        self.push_status = push_status
+        self.pairing_mode = pairing_mode
+        self._key = bytes(key) if key is not None else None
+        self._clock = clock
+        self._random = random.Random(seed)
+
+        self.client: Optional["FakeSkyCookerClient"] = None
+        self.authorized = False
+        self.time_offset = (0, 0)
+        self.sound_enabled = True
+
+        # Параметры выбранной программы
+        self.program_id = 0
+        self.subprogram_id = 0
+        self.target_temperature = 0
+        self.main_hours = 0
+        self.main_minutes = 0
+        self.additional_hours = 0
+        self.additional_minutes = 0
+        self.auto_warm = 0
+        self.bit_flags = 0
+
+        # Текущая фаза, момент ее начала и таймер рассылки смены фазы
+        self._state = STATUS_OFF
+        self._state_since = 0.0
+        self._transition_handle: Optional[asyncio.TimerHandle] = None
+        # Время доставки последнего уведомления: BLE доставляет уведомления по порядку
+        self._last_delivery = 0.0
+
+        # Статистика для бенчмарков
+        self.frames_received = 0
+        self.frames_sent = 0
+        self.frames_dropped = 0
+        self.commands: Dict[int, int] = {}
+        self.connects = 0
+
+    def now(self) -> float:
+        """Текущее время симуляции."""
+        if self._clock:
+            return self._clock()
+        return asyncio.get_running_loop().time()
+
+    async def connect(self, mac_address: Optional[str] = None) -> "FakeSkyCookerClient":
+        """Фабрика клиента для SkyCookerConnectionManager(client_factory=...)."""
+        if self.client and self.client.is_connected:
+            raise IOError("out of connection slots")
+        if self.connect_latency:
+            await asyncio.sleep(self.connect_latency)
+        self.connects += 1
+        self.authorized = False
+        self.client = FakeSkyCookerClient(self, mac_address)
+        return self.client
+
+    # Переходы статусов
+
+    @property
+    def state(self) -> int:
+        """Текущий код статуса с учетом прошедшего времени."""
+        self._advance()
+        return self._state
+
+    def _set_state(self, state: int, since: Optional[float] = None) -> None:
+        self._state = state
+        self._state_since = self.now() if since is None else since
+        if self._transition_handle:
+            self._transition_handle.cancel()
+            self._transition_handle = None
+        duration = self._phase_duration()
+        if self.push_status and duration is not None:
+            # Смена фазы рассылается, даже если статус никто не запрашивает
+            delay = max(0.0, self._state_since + duration - self.now())
+            self._transition_handle = asyncio.get_running_loop().call_later(delay, self._advance)
+
+    def _phase_duration(self) -> Optional[float]:
+        """Длительность текущей фазы или None, если фаза не заканчивается сама."""
+        if self._state == STATUS_DELAYED_LAUNCH:
+            return self.additional_hours * 3600 + self.additional_minutes * 60
+        if self._state == STATUS_WARMING:
+            return self.warming_time
+        if self._state == STATUS_COOKING:
+            return self.main_hours * 3600 + self.main_minutes * 60
+        return None
+
+    def _advance(self) -> None:
+        """Продвижение фаз, закончившихся к текущему моменту."""
+        now = self.now()
+        changed = False
+        while True:
+            duration = self._phase_duration()
+            if duration is None or self._state_since + duration > now:
+                break
+            end = self._state_since + duration
+            if self._state == STATUS_DELAYED_LAUNCH:
+                self._set_state(STATUS_WARMING, end)
+            elif self._state == STATUS_WARMING:
+                self._set_state(STATUS_COOKING, end)
+            else:
+                self._set_state(STATUS_AUTO_WARM if self.auto_warm else STATUS_OFF, end)
+            changed = True
+        if changed and self.push_status:
+            self._notify(self._frame(0, COMMAND_GET_STATUS, self.status_payload()))
+
+    def _remaining(self) -> tuple:
+        """Оставшееся время фазы в часах и минутах (округление вверх)."""
+        duration = self._phase_duration()
+        if duration is None:
+            return self.additional_hours, self.additional_minutes
+        left = max(0, int(self._state_since + duration - self.now() + 59) // 60)
+        return left // 60, left % 60
+
+    def status_payload(self) -> bytes:
+        """16 байт статуса в формате ответа на GET_STATUS."""
+        state = self.state
+        additional_hours, additional_minutes = self.additional_hours, self.additional_minutes
+        if state in [STATUS_DELAYED_LAUNCH, STATUS_COOKING]:
+            additional_hours, additional_minutes = self._remaining()
+        return bytes([
+            self.program_id, self.subprogram_id, self.target_temperature,
+            self.main_hours, self.main_minutes, additional_hours, additional_minutes,
+            self.auto_warm, state, 1 if self.sound_enabled else 0,
+            0, 0, 0, 0, 0, 0,
+        ])
+
+    # Обработка команд
+
+    def _handle_command(self, command: int, params: bytes) -> Optional[bytes]:
+        """Выполнение команды. Возвращает данные ответа или None, если ответа нет."""
+        self.commands[command] = self.commands.get(command, 0) + 1
+        if command == COMMAND_AUTH:
+            return bytes([1 if self._auth(params) else 0])
+        if not self.authorized:
+            # Без авторизации устройство не отвечает на команды
+            return None
+        if command == COMMAND_GET_VERSION:
+            return bytes(self.version)
+        if command == COMMAND_GET_STATUS:
+            return self.status_payload()
+        if command == COMMAND_SELECT_PROGRAM:
+            return self._select_program(params)
+        if command == COMMAND_SET_MAIN_MODE:
+            return self._set_main_mode(params)
+        if command == COMMAND_TURN_ON:
+            return self._turn_on()
+        if command == COMMAND_TURN_OFF:
+            self._advance()
+            self._set_state(STATUS_OFF)
+            return bytes([1])
+        if command == COMMAND_SYNC_TIME:
+            if len(params) != 8:
+                return bytes([1])
+            self.time_offset = unpack("<ii", params)
+            return bytes([0])
+        if command == COMMAND_GET_TIME:
+            now, offset = self.time_offset
+            return pack("<ii", now or int(time.time()), offset)
+        _LOGGER.debug(f"🤷 Неизвестная команда {command:02x}")
+        return bytes([0])
+
+    def _auth(self, key: bytes) -> bool:
+        if self._key is None and self.pairing_mode:
+            self._key = bytes(key)
+        self.authorized = self._key is not None and bytes(key) == self._key
+        return self.authorized
+
+    def _check_program(self, program_id: int) -> bool:
+        return 0 <= program_id < len(self.program_constants) and self.program_constants[program_id] != PROGRAM_NONE
+
+    def _program_state(self) -> int:
+        """Статус после выбора программы: ожидание запуска или выключено для режима ожидания."""
+        return STATUS_OFF if self.program_constants[self.program_id] == PROGRAM_STANDBY else STATUS_WAIT
+
+    def _select_program(self, params: bytes) -> bytes:
+        if len(params) != SELECT_PROGRAM_LENGTH[self.subprogram_supported]:
+            return bytes([0])
+        if not self._check_program(params[0]):
+            return bytes([0])
+        self._advance()
+        if self._state not in [STATUS_OFF, STATUS_WAIT, STATUS_FULL_OFF]:
+            return bytes([0])
+        self.program_id = params[0]
+        self.subprogram_id = params[1] if self.subprogram_supported else 0
+        program_data = PROGRAM_DATA.get(self.model_id, [])
+        if self.program_id < len(program_data):
+            data = program_data[self.program_id]
+            self.target_temperature = data["temperature"]
+            self.main_hours = data["hours"]
+            self.main_minutes = data["minutes"]
+            self.bit_flags = data["byte_flag"]
+        self._set_state(self._program_state())
+        return bytes([1])
+
+    def _set_main_mode(self, params: bytes) -> bytes:
+        if len(params) != SET_MAIN_MODE_LENGTH[self.subprogram_supported]:
+            return bytes([0])
+        if not self._check_program(params[0]):
+            return bytes([0])
+        self._advance()
+        if self._state not in [STATUS_OFF, STATUS_WAIT, STATUS_FULL_OFF]:
+            return bytes([0])
+        (self.program_id, self.subprogram_id, self.target_temperature, self.main_hours, self.main_minutes,
+         self.additional_hours, self.additional_minutes, self.auto_warm) = params[:8]
+        if self.subprogram_supported:
+            self.bit_flags = params[8]
+        self._set_state(self._program_state())
+        return bytes([1])
+
+    def _turn_on(self) -> bytes:
+        self._advance()
+        if self._state != STATUS_WAIT:
+            return bytes([0])
+        if self.additional_hours or self.additional_minutes:
+            self._set_state(STATUS_DELAYED_LAUNCH)
+        else:
+            self._set_state(STATUS_WARMING)
+        return bytes([1])
+
+    def start_program(self, program_id: int, hours: Optional[int] = None, minutes: Optional[int] = None,
+                      auto_warm: int = 0) -> None:
+        """Запуск программы с панели устройства (без команд по BLE)."""
+        if not self._check_program(program_id):
+            raise ValueError(f"Программа {program_id} не поддерживается моделью {self.model_name}")
+        self.program_id = program_id
+        self.subprogram_id = 0
+        program_data = PROGRAM_DATA.get(self.model_id, [])
+        if program_id < len(program_data):
+            data = program_data[program_id]
+            self.target_temperature = data["temperature"]
+            self.main_hours = data["hours"]
+            self.main_minutes = data["minutes"]
+            self.bit_flags = data["byte_flag"]
+        if hours is not None:
+            self.main_hours = hours
+        if minutes is not None:
+            self.main_minutes = minutes
+        self.additional_hours = self.additional_minutes = 0
+        self.auto_warm = auto_warm
+        self._set_state(STATUS_WARMING)
+
+    # Транспорт
+
+    @staticmethod
+    def _frame(iter_id: int, command: int, payload: bytes) -> bytes:
+        return bytes([FRAME_START, iter_id, command]) + bytes(payload) + bytes([FRAME_END])
+
+    def write(self, data: bytes) -> None:
+        """Прием кадра команды от клиента."""
+        self.frames_received += 1
+        if len(data) < 4 or data[0] != FRAME_START or data[-1] != FRAME_END:
+            _LOGGER.debug(f"🗑️  Симулятор отбросил некорректный кадр: {bytes(data).hex().upper()}")
+            return
+        iter_id, command, params = data[1], data[2], bytes(data[3:-1])
+        payload = self._handle_command(command, params)
+        if payload is None:
+            return
+        if command in self.status_ack_commands and payload == bytes([1]):
+            frame = self._frame(iter_id, COMMAND_GET_STATUS, self.status_payload())
+        else:
+            frame = self._frame(iter_id, command, payload)
+        if self._random.random() < self.drop_rate:
+            self.frames_dropped += 1
+        else:
+            self._notify(frame)
+        if self.push_status and command in [COMMAND_SET_MAIN_MODE, COMMAND_SELECT_PROGRAM,
+                                            COMMAND_TURN_ON, COMMAND_TURN_OFF]:
+            self._notify(self._frame(0, COMMAND_GET_STATUS, self.status_payload()))
+
+    def _notify(self, frame: bytes) -> None:
+        """Отправка кадра уведомлениями по MTU с задержкой."""
+        client = self.client
+        if not client or not client.is_connected:
+            return
+        loop = asyncio.get_running_loop()
+        delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0)
+        deliver_at = max(loop.time() + delay, self._last_delivery)
+        self._last_delivery = deliver_at
+        chunks = [frame[i:i + self.mtu] for i in range(0, len(frame), self.mtu)]
+        self.frames_sent += 1
+        loop.call_at(deliver_at, client.deliver, chunks)
+
+
+class FakeSkyCookerClient:
+    """GATT клиент симулятора с интерфейсом BleakClientWithServiceCache."""
+
+    def __init__(self, device: FakeSkyCookerDevice, address: Optional[str] = None) -> None:
+        self._device = device
+        self.address = address
+        self._connected = True
+        self._callbacks: Dict[str, Callable[[Any, bytearray], None]] = {}
+
+    @property
+    def is_connected(self) -> bool:
+        return self._connected
+
+    async def start_notify(self, char_specifier: str, callback: Callable[[Any, bytearray], None]) -> None:
+        if char_specifier != UUID_RX:
+            raise ValueError(f"Характеристика {char_specifier} не поддерживает уведомления")
+        self._callbacks[char_specifier] = callback
+
+    async def stop_notify(self, char_specifier: str) -> None:
+        self._callbacks.pop(char_specifier, None)
+
+    async def write_gatt_char(self, char_specifier: str, data: bytes, response: bool = False) -> None:
+        if not self._connected:
+            raise IOError("Not connected")
+        if char_specifier != UUID_TX:
+            raise ValueError(f"Характеристика {char_specifier} недоступна для записи")
+        self._device.write(bytes(data))
+
+    def deliver(self, chunks: List[bytes]) -> None:
+        """Доставка уведомлений подписчику UUID_RX."""
+        callback = self._callbacks.get(UUID_RX)
+        if not self._connected or not callback:
+            return
+        for chunk in chunks:
+            callback(UUID_RX, bytearray(chunk))
+
+    async def disconnect(self) -> bool:
+        self._connected = False
+        self._callbacks.clear()
+        if self._device.client is self:
+            self._device.authorized = False
+        return True
@@ -0,0 +1,264 @@
+#!/usr/local/bin/python3
+# coding: utf-8
+"""Бенчмарк транспорта SkyCooker на симулированном устройстве.
+
+Прогоняет command, get_status, полную последовательность start() и
+SkyCookerStateManager.update против FakeSkyCookerDevice и сохраняет
+p50/p95/p99 задержки, команды в секунду, пробуждения цикла событий на команду
+и процессорное время на операцию в JSON, чтобы запуски можно было сравнивать:
+
+    python -m benchmarks.run_benchmark --iterations 200 --latency 0.03 --jitter 0.01 --output bench.json
+
+С --virtual-time задержки и команды в секунду считаются во времени симуляции,
+а сценарий session (полная многочасовая готовка с адаптивным опросом)
+выполняется за доли секунды:
+
+    python -m benchmarks.run_benchmark --virtual-time --scenarios session --session-hours 2
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from custom_components.skycooker.const import *
+from custom_components.skycooker.programs import get_program_constants
+from custom_components.skycooker.skycooker_connection import SkyCookerConnection
+from custom_components.skycooker.time import get_poll_interval
+
+from .fake_skycooker import FakeSkyCookerDevice
+from .virtual_clock import VirtualClock, VirtualTimeEventLoop
+
+_LOGGER = logging.getLogger(__name__)
+
+SCENARIOS = ["command", "get_status", "start", "update", "session"]
+DEFAULT_SCENARIOS = ["command", "get_status", "start", "update"]
+BENCH_MAC = "AA:BB:CC:DD:EE:FF"
+BENCH_KEY = [0] * 8
+
+
+class WakeupCounterMixin:
+    """Подсчет итераций (пробуждений) цикла событий."""
+
+    wakeups = 0
+
+    def _run_once(self) -> None:
+        self.wakeups += 1
+        super()._run_once()
+
+
+class CountingEventLoop(WakeupCounterMixin, asyncio.SelectorEventLoop):
+    """Обычный цикл событий со счетчиком пробуждений."""
+
+
+class CountingVirtualTimeEventLoop(WakeupCounterMixin, VirtualTimeEventLoop):
+    """Цикл событий с виртуальным временем и счетчиком пробуждений."""
+
+
+def percentile(values: List[float], percent: float) -> Optional[float]:
+    """Процентиль по методу ближайшего ранга."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, int(round(percent / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[rank]
+
+
+def summarize(latencies: List[float], errors: int, commands: int, wakeups: int, cpu: float, wall: float) -> Dict[str, Any]:
+    """Сводка метрик одного сценария."""
+    ops = len(latencies) + errors
+    to_ms = lambda value: None if value is None else round(value * 1000, 3)
+    return {
+        "iterations": ops,
+        "errors": errors,
+        "latency_ms": {
+            "p50": to_ms(percentile(latencies, 50)),
+            "p95": to_ms(percentile(latencies, 95)),
+            "p99": to_ms(percentile(latencies, 99)),
+            "mean": to_ms(sum(latencies) / len(latencies)) if latencies else None,
+            "max": to_ms(max(latencies)) if latencies else None,
+        },
+        "commands": commands,
+        "commands_per_second": round(commands / wall, 2) if wall else None,
+        "loop_wakeups_per_command": round(wakeups / commands, 2) if commands else None,
+        "cpu_ms_per_op": round(cpu * 1000 / ops, 4) if ops else None,
+    }
+
+
+def get_bench_program_id(model_id: int) -> int:
+    """Первая настоящая программа модели (не ожидание и не пустая)."""
+    for program_id, program_constant in enumerate(get_program_constants(model_id)):
+        if program_constant and program_constant not in [PROGRAM_STANDBY, PROGRAM_NONE]:
+            return program_id
+    raise ValueError(f"У модели {model_id} нет программ")
+
+
+async def run_scenario(
+    name: str,
+    skycooker: SkyCookerConnection,
+    device: FakeSkyCookerDevice,
+    args: argparse.Namespace,
+) -> Dict[str, Any]:
+    """Прогон одного сценария с замером задержек и накладных расходов."""
+    manager = skycooker.connection_manager
+    controller = skycooker.cooking_controller
+    program_id = get_bench_program_id(manager.model_id)
+
+    async def prepare_start() -> None:
+        # Возврат устройства в исходное состояние не входит в замер
+        await manager.connect_if_need()
+        await manager.command(COMMAND_TURN_OFF)
+        controller.status = await manager.get_status()
+        await controller.set_target_program_id(program_id)
+
+    async def cooking_session() -> bool:
+        # Готовка запускается с панели, интеграция опрашивает ее до окончания
+        device.start_program(program_id, hours=args.session_hours, minutes=0)
+        while True:
+            if await skycooker.update() is False:
+                return False
+            if skycooker.status_code not in [STATUS_DELAYED_LAUNCH, STATUS_WARMING, STATUS_COOKING]:
+                return True
+            await skycooker.clock.sleep(get_poll_interval(skycooker.status, skycooker.status_code, args.scan_interval))
+
+    operations: Dict[str, Callable[[], Awaitable[Any]]] = {
+        "command": lambda: manager.command(COMMAND_GET_STATUS),
+        "get_status": manager.get_status,
+        "start": controller.start,
+        "update": skycooker.update,
+        "session": cooking_session,
+    }
+    async def prepare_nothing() -> None:
+        # Опрос замеряется целиком: при непостоянном соединении в него входят
+        # подключение, AUTH и GET_VERSION
+        pass
+
+    prepares: Dict[str, Callable[[], Awaitable[Any]]] = {
+        "start": prepare_start,
+        "update": prepare_nothing,
+    }
+    prepare = prepares.get(name, manager.connect_if_need)
+    operation = operations[name]
+
+    loop = asyncio.get_running_loop()
+    latencies: List[float] = []
+    errors = commands = wakeups = 0
+    cpu = wall = 0.0
+    for _ in range(args.iterations):
+        try:
+            await prepare()
+        except Exception as e:
+            _LOGGER.debug(f"🚫 Ошибка подготовки сценария {name}: {e}")
+        frames_before = device.frames_received
+        wakeups_before = getattr(loop, "wakeups", 0)
+        cpu_before = time.process_time()
+        started = loop.time()
+        try:
+            result = await operation()
+            ok = result is not False
+        except Exception as e:
+            _LOGGER.debug(f"🚫 Ошибка сценария {name}: {e}")
+            ok = False
+        elapsed = loop.time() - started
+        cpu += time.process_time() - cpu_before
+        wall += elapsed
+        wakeups += getattr(loop, "wakeups", 0) - wakeups_before
+        commands += device.frames_received - frames_before
+        if ok:
+            latencies.append(elapsed)
+        else:
+            errors += 1
+    return summarize(latencies, errors, commands, wakeups, cpu, wall)
+
+
+async def run_benchmarks(args: argparse.Namespace) -> Dict[str, Any]:
+    """Прогон выбранных сценариев на отдельных экземплярах устройства."""
+    results = {}
+    for name in args.scenarios:
+        device = FakeSkyCookerDevice(
+            args.model,
+            latency=args.latency,
+            jitter=args.jitter,
+            drop_rate=args.drop_rate,
+            connect_latency=args.connect_latency,
+            mtu=args.mtu,
+            seed=args.seed,
+        )
+        skycooker = SkyCookerConnection(
+            BENCH_MAC, BENCH_KEY, args.persistent, None, None, args.model,
+            client_factory=device.connect, clock=VirtualClock(), linger=args.linger
+        )
+        try:
+            results[name] = await run_scenario(name, skycooker, device, args)
+        finally:
+            await skycooker.stop()
+        _LOGGER.info(f"📊 {name}: {json.dumps(results[name], ensure_ascii=False)}")
+    return results
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Бенчмарк транспорта SkyCooker на симулированном устройстве")
+    parser.add_argument("--model", default="RMC-M40S", help="модель устройства (ключ MODELS)")
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=DEFAULT_SCENARIOS)
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.03, help="задержка ответа устройства, с")
+    parser.add_argument("--jitter", type=float, default=0.01, help="разброс задержки, с")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="доля потерянных ответов")
+    parser.add_argument("--connect-latency", type=float, default=0.5, help="время подключения, с")
+    parser.add_argument("--mtu", type=int, default=20)
+    parser.add_argument("--persistent", action=argparse.BooleanOptionalAction, default=True)
+    parser.add_argument("--linger", type=float, default=DEFAULT_LINGER_TIME, help="окно удержания непостоянного соединения, с")
+    parser.add_argument("--scan-interval", type=int, default=DEFAULT_SCAN_INTERVAL, help="интервал опроса в сценарии session, с")
+    parser.add_argument("--session-hours", type=int, default=1, help="длительность готовки в сценарии session, ч")
+    parser.add_argument("--virtual-time", action="store_true", help="выполнять сценарии в виртуальном времени")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", default="bench_output.json", help="файл для результатов в JSON")
+    parser.add_argument("--verbose", action="store_true")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO)
+    if not args.verbose:
+        logging.getLogger("custom_components.skycooker").setLevel(logging.CRITICAL)
+    loop_factory = CountingVirtualTimeEventLoop if args.virtual_time else CountingEventLoop
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        results = runner.run(run_benchmarks(args))
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "parameters": {
+            "model": args.model,
+            "iterations": args.iterations,
+            "latency": args.latency,
+            "jitter": args.jitter,
+            "drop_rate": args.drop_rate,
+            "connect_latency": args.connect_latency,
+            "mtu": args.mtu,
+            "persistent": args.persistent,
+            "linger": args.linger,
+            "scan_interval": args.scan_interval,
+            "session_hours": args.session_hours,
+            "virtual_time": args.virtual_time,
+            "seed": args.seed,
+        },
+        "constants": {
+            "BLE_RECV_TIMEOUT": BLE_RECV_TIMEOUT,
+            "TRIES_INTERVAL": TRIES_INTERVAL,
+            "MAX_TRIES": MAX_TRIES,
+            "FRAME_FLUSH_DELAY": FRAME_FLUSH_DELAY,
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(report, file, ensure_ascii=False, indent=2)
+    _LOGGER.info(f"💾 Результаты сохранены в {args.output}")
+
+
+if __name__ == "__main__":
+    main()
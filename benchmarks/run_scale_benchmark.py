@@ -0,0 +1,253 @@
+#!/usr/local/bin/python3
+# coding: utf-8
+"""Нагрузочный стенд: N мультиварок на одном экземпляре Home Assistant.
+
+Для каждого N создает N конфигурационных входов, настраивает их через
+async_setup_entry (каждый вход работает с собственным FakeSkyCookerDevice) и
+на фиксированное время запускает настоящий планировщик опроса, рассылку
+обновлений по диспетчеру и платформы sensor/select/switch/button. Измеряет
+задержку цикла событий, записи состояний в секунду, память на устройство и
+опоздания опросов, чтобы регрессии масштабирования в __init__.py и
+entity_base.py были видны по росту N.
+
+Требует pytest-homeassistant-custom-component (тестовый экземпляр HA):
+
+    python -m benchmarks.run_scale_benchmark --devices 1 10 50 100 --duration 60 --output scale.json
+"""
+
+import argparse
+import asyncio
+import functools
+import gc
+import json
+import logging
+import platform
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+from unittest.mock import patch
+
+from homeassistant import loader
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import CONF_FRIENDLY_NAME, CONF_MAC, CONF_PASSWORD, CONF_SCAN_INTERVAL
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_test_home_assistant
+
+import custom_components.skycooker as skycooker_integration
+from custom_components.skycooker.const import *
+from custom_components.skycooker.entity_base import SkyCookerEntity
+from custom_components.skycooker.skycooker_connection import SkyCookerConnection
+
+from .fake_skycooker import FakeSkyCookerDevice
+from .run_benchmark import get_bench_program_id, percentile
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def get_fake_mac(index: int) -> str:
+    """MAC адрес симулируемой мультиварки по ее номеру."""
+    return ":".join(["AA", "BB"] + [f"{(index >> shift) & 0xFF:02X}" for shift in (24, 16, 8, 0)])
+
+
+class ScaleProbe:
+    """Счетчики и замеры одного прогона."""
+
+    def __init__(self, deadline_tolerance: float) -> None:
+        self.deadline_tolerance = deadline_tolerance
+        self.state_writes = 0
+        self.polls = 0
+        self.poll_lateness: List[float] = []
+        self.deadline_misses = 0
+        self.loop_lag: List[float] = []
+
+    def wrap_state_write(self, original):
+        @functools.wraps(original)
+        def async_write_ha_state(entity):
+            self.state_writes += 1
+            original(entity)
+        return async_write_ha_state
+
+    def wrap_call_at(self, original):
+        """Обертка async_call_at, замеряющая опоздание опросов SkyCooker."""
+        @functools.wraps(original)
+        def async_call_at(hass, action, loop_time):
+            if not getattr(action, "__qualname__", "").startswith("_create_poll_scheduler"):
+                return original(hass, action, loop_time)
+
+            async def timed_poll(now, **kwargs):
+                lateness = hass.loop.time() - loop_time
+                self.polls += 1
+                self.poll_lateness.append(lateness)
+                if lateness > self.deadline_tolerance:
+                    self.deadline_misses += 1
+                await action(now, **kwargs)
+
+            return original(hass, timed_poll, loop_time)
+        return async_call_at
+
+    async def measure_loop_lag(self, interval: float) -> None:
+        """Фоновый замер задержки цикла событий."""
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + interval
+            await asyncio.sleep(interval)
+            self.loop_lag.append(max(0.0, loop.time() - expected))
+
+
+async def run_scale(count: int, args: argparse.Namespace) -> Dict[str, Any]:
+    """Прогон стенда для count мультиварок."""
+    probe = ScaleProbe(args.deadline_tolerance)
+    devices: Dict[str, FakeSkyCookerDevice] = {}
+
+    def create_connection(*conn_args, mac: str, **kwargs) -> SkyCookerConnection:
+        return SkyCookerConnection(*conn_args, mac=mac, client_factory=devices[mac].connect, **kwargs)
+
+    async with async_test_home_assistant() as hass:
+        hass.config.language = args.language
+        # Разрешаем загрузку интеграций из custom_components рядом со стендом
+        hass.data.pop(loader.DATA_CUSTOM_COMPONENTS, None)
+        await loader.async_get_integration(hass, DOMAIN)
+
+        entries = []
+        for index in range(count):
+            mac = get_fake_mac(index)
+            device = FakeSkyCookerDevice(
+                args.model,
+                latency=args.latency,
+                jitter=args.jitter,
+                drop_rate=args.drop_rate,
+                connect_latency=args.connect_latency,
+                seed=args.seed + index,
+            )
+            if index < round(count * args.cooking_fraction):
+                device.start_program(get_bench_program_id(device.model_id), hours=1, minutes=0)
+            devices[mac] = device
+            entry = MockConfigEntry(
+                domain=DOMAIN,
+                unique_id=f"{DOMAIN}-{mac}",
+                title=f"{args.model} ({mac})",
+                data={
+                    CONF_MAC: mac,
+                    CONF_PASSWORD: [0] * 8,
+                    CONF_FRIENDLY_NAME: args.model,
+                    CONF_SCAN_INTERVAL: args.scan_interval,
+                    CONF_PERSISTENT_CONNECTION: args.persistent,
+                    CONF_LINGER_TIME: args.linger,
+                },
+            )
+            entry.add_to_hass(hass)
+            entries.append(entry)
+
+        async def setup_entry(entry) -> bool:
+            entry.mock_state(hass, ConfigEntryState.SETUP_IN_PROGRESS)
+            async with entry.setup_lock:
+                ok = await skycooker_integration.async_setup_entry(hass, entry)
+            entry.mock_state(hass, ConfigEntryState.LOADED if ok else ConfigEntryState.SETUP_ERROR)
+            return ok
+
+        with patch.object(skycooker_integration, "SkyCookerConnection", create_connection), \
+                patch.object(SkyCookerEntity, "async_write_ha_state",
+                             probe.wrap_state_write(SkyCookerEntity.async_write_ha_state)), \
+                patch.object(skycooker_integration.ev, "async_call_at",
+                             probe.wrap_call_at(skycooker_integration.ev.async_call_at)):
+            await skycooker_integration.async_setup(hass, {})
+
+            gc.collect()
+            tracemalloc.start()
+            memory_before = tracemalloc.get_traced_memory()[0]
+            setup_started = time.perf_counter()
+            results = await asyncio.gather(*[setup_entry(entry) for entry in entries])
+            await hass.async_block_till_done()
+            setup_time = time.perf_counter() - setup_started
+            gc.collect()
+            memory_after = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+
+            writes_before = probe.state_writes
+            lag_task = hass.loop.create_task(probe.measure_loop_lag(args.lag_interval))
+            cpu_before = time.process_time()
+            await asyncio.sleep(args.duration)
+            cpu = time.process_time() - cpu_before
+            lag_task.cancel()
+            state_writes = probe.state_writes - writes_before
+
+            for entry in entries:
+                if entry.state is ConfigEntryState.LOADED:
+                    await skycooker_integration.async_unload_entry(hass, entry)
+                    entry.mock_state(hass, ConfigEntryState.NOT_LOADED)
+            await hass.async_block_till_done()
+
+    to_ms = lambda value: None if value is None else round(value * 1000, 3)
+    return {
+        "devices": count,
+        "setup_ok": sum(1 for ok in results if ok),
+        "setup_seconds": round(setup_time, 3),
+        "memory_per_device_kib": round((memory_after - memory_before) / count / 1024, 2),
+        "loop_lag_ms": {
+            "p50": to_ms(percentile(probe.loop_lag, 50)),
+            "p99": to_ms(percentile(probe.loop_lag, 99)),
+            "max": to_ms(max(probe.loop_lag)) if probe.loop_lag else None,
+        },
+        "state_writes": state_writes,
+        "state_writes_per_second": round(state_writes / args.duration, 2),
+        "polls": probe.polls,
+        "poll_lateness_ms": {
+            "p50": to_ms(percentile(probe.poll_lateness, 50)),
+            "p99": to_ms(percentile(probe.poll_lateness, 99)),
+        },
+        "poll_deadline_misses": probe.deadline_misses,
+        "device_commands": sum(sum(device.commands.values()) for device in devices.values()),
+        "cpu_seconds": round(cpu, 3),
+    }
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Нагрузочный стенд SkyCooker на N симулированных мультиварках")
+    parser.add_argument("--devices", type=int, nargs="+", default=[1, 10, 50, 100], help="значения N")
+    parser.add_argument("--duration", type=float, default=60.0, help="время прогона для каждого N, с")
+    parser.add_argument("--model", default="RMC-M40S", help="модель устройства (ключ MODELS)")
+    parser.add_argument("--scan-interval", type=int, default=DEFAULT_SCAN_INTERVAL)
+    parser.add_argument("--persistent", action=argparse.BooleanOptionalAction, default=True)
+    parser.add_argument("--linger", type=int, default=DEFAULT_LINGER_TIME, help="окно удержания непостоянного соединения, с")
+    parser.add_argument("--cooking-fraction", type=float, default=0.5, help="доля мультиварок в режиме готовки")
+    parser.add_argument("--latency", type=float, default=0.03, help="задержка ответа устройства, с")
+    parser.add_argument("--jitter", type=float, default=0.01, help="разброс задержки, с")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="доля потерянных ответов")
+    parser.add_argument("--connect-latency", type=float, default=0.5, help="время подключения, с")
+    parser.add_argument("--deadline-tolerance", type=float, default=1.0, help="опоздание опроса, считающееся промахом, с")
+    parser.add_argument("--lag-interval", type=float, default=0.1, help="период замера задержки цикла, с")
+    parser.add_argument("--language", default="en")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", default="bench_scale_output.json", help="файл для результатов в JSON")
+    parser.add_argument("--verbose", action="store_true")
+    return parser.parse_args(argv)
+
+
+async def run_all(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    results = []
+    for count in args.devices:
+        results.append(await run_scale(count, args))
+        _LOGGER.info(f"📊 N={count}: {json.dumps(results[-1], ensure_ascii=False)}")
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO)
+    if not args.verbose:
+        logging.getLogger("custom_components.skycooker").setLevel(logging.CRITICAL)
+        logging.getLogger("homeassistant").setLevel(logging.WARNING)
+    results = asyncio.run(run_all(args))
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "parameters": {key: value for key, value in vars(args).items() if key not in ["output", "verbose"]},
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(report, file, ensure_ascii=False, indent=2)
+    _LOGGER.info(f"💾 Результаты сохранены в {args.output}")
+
+
+if __name__ == "__main__":
+    main()
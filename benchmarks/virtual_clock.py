@@ -0,0 +1,57 @@
+#!/usr/local/bin/python3
+# coding: utf-8
+"""Виртуальное время для бенчмарков и проверок.
+
+VirtualTimeEventLoop - цикл событий, время которого не связано с реальным:
+когда готовых задач нет, время сразу переводится к ближайшему таймеру. Таймауты,
+call_later и asyncio.sleep срабатывают в том же порядке, что и в реальном
+времени, но многочасовая сессия готовки проходит за миллисекунды.
+VirtualClock - SkyCookerClock, берущий время из этого цикла:
+
+    with asyncio.Runner(loop_factory=VirtualTimeEventLoop) as runner:
+        runner.run(main())  # внутри: SkyCookerConnection(..., clock=VirtualClock())
+"""
+
+import asyncio
+import time
+
+from custom_components.skycooker.skycooker_clock import SkyCookerClock
+
+
+class VirtualTimeEventLoop(asyncio.SelectorEventLoop):
+    """Цикл событий с виртуальным временем."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._virtual_time = 0.0
+        self._real_select = self._selector.select
+        self._selector.select = self._virtual_select
+
+    def time(self) -> float:
+        return self._virtual_time
+
+    def _virtual_select(self, timeout=None):
+        if timeout is None:
+            # Таймеров нет: ждем только реальный ввод-вывод (например, исполнители)
+            return self._real_select(None)
+        events = self._real_select(0)
+        if not events and timeout > 0:
+            self._virtual_time += timeout
+        return events
+
+    def advance(self, seconds: float) -> None:
+        """Принудительный сдвиг виртуального времени."""
+        self._virtual_time += seconds
+
+
+class VirtualClock(SkyCookerClock):
+    """Часы интеграции, идущие по времени текущего цикла событий.
+
+    С VirtualTimeEventLoop время виртуальное, с обычным циклом - монотонное реальное.
+    """
+
+    def monotonic(self) -> float:
+        try:
+            return asyncio.get_running_loop().time()
+        except RuntimeError:
+            return time.monotonic()
@@ -1,24 +1,31 @@
 """Support for SkyCooker."""
 import json
 import logging
+import math
 import os
 from datetime import timedelta
 
 import aiofiles
+import voluptuous as vol
 import homeassistant.helpers.event as ev
 from packaging import version
 
+from homeassistant.components import bluetooth
 from homeassistant.const import __version__ as HA_VERSION
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (CONF_DEVICE,
                                   CONF_FRIENDLY_NAME, CONF_MAC, CONF_PASSWORD,
                                   CONF_SCAN_INTERVAL, Platform)
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.dispatcher import dispatcher_send
 from homeassistant.helpers.entity import DeviceInfo
 
 from .const import *
 from .skycooker_connection import SkyCookerConnection
+from .skycooker_connection_budget import SkyCookerConnectionBudget, get_connection_budget
+from .programs import invalidate_program_index
+from .skycooker_session_store import async_get_session_store
+from .time import get_poll_interval
+from .utils import get_dispatcher_signal
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,6 +36,18 @@ PLATFORMS = [
     Platform.BUTTON
 ]
 
+# Общие настройки интеграции (configuration.yaml)
+CONFIG_SCHEMA = vol.Schema(
+    {
+        vol.Optional(DOMAIN): vol.Schema({
+            vol.Optional(CONF_MAX_CONNECTIONS): vol.All(
+                vol.Coerce(int), vol.Range(min=1)
+            ),
+        })
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
 async def async_setup(hass, config):
     """Настройка компонента SkyCooker."""
     # Проверка минимальной версии HomeAssistant
@@ -39,6 +58,10 @@ async def async_setup(hass, config):
         return False
     
     hass.data.setdefault(DOMAIN, {})
+    # Лимит одновременных непостоянных соединений на адаптер - общий для всех мультиварок (по умолчанию не ограничен)
+    max_connections = config.get(DOMAIN, {}).get(CONF_MAX_CONNECTIONS)
+    if max_connections:
+        hass.data[DATA_CONNECTION_BUDGET] = SkyCookerConnectionBudget(max_connections)
     if "skycooker_translations" not in hass.data:
         await load_translations(hass)
     _LOGGER.debug("✅ Интеграция SkyCooker загружена. Версия HA: %s", HA_VERSION)
@@ -81,20 +104,92 @@ async def load_translations(hass):
         translations = {}
 
     hass.data["skycooker_translations"] = translations
+    # Индексы программ строятся по переводам и должны быть перестроены
+    invalidate_program_index(hass)
 
 
 def _create_poll_scheduler(hass, entry, skycooker):
-    """Создаёт poll и schedule_poll для периодического обновления статуса."""
+    """Создаёт poll, schedule_poll и poll_now для периодического обновления статуса.
+
+    Интервал до следующего опроса выбирается по последнему статусу, а сам опрос
+    привязан к сетке от запланированного времени, поэтому длительность
+    обновления не накапливает сдвиг.
+    """
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    next_poll = {"at": None, "running": False}
+
     def schedule_poll(td):
-        hass.data[DOMAIN][DATA_CANCEL] = ev.async_call_later(hass, td, poll)
+        schedule_poll_at(hass.loop.time() + td.total_seconds())
+
+    def schedule_poll_at(loop_time):
+        next_poll["at"] = loop_time
+        entry_data[DATA_CANCEL] = ev.async_call_at(hass, poll, loop_time)
+
+    def poll_now():
+        """Внеочередной опрос вместо запланированного (если опрос сейчас не идет)."""
+        if next_poll["running"] or not entry_data.get(DATA_WORKING):
+            return
+        if entry_data.get(DATA_CANCEL):
+            entry_data[DATA_CANCEL]()
+        schedule_poll_at(hass.loop.time())
 
     async def poll(now, **kwargs) -> None:
-        await skycooker.update()
-        await hass.async_add_executor_job(dispatcher_send, hass, DISPATCHER_UPDATE)
-        if hass.data[DOMAIN][DATA_WORKING]:
-            schedule_poll(timedelta(seconds=entry.data[CONF_SCAN_INTERVAL]))
+        scan_interval = entry.data[CONF_SCAN_INTERVAL]
+        next_poll["running"] = True
+        try:
+            # При постоянном соединении устройство само присылает статус (0x06), опрос не нужен
+            if skycooker.connected and skycooker.status_push_age < scan_interval:
+                _LOGGER.debug("📡 Статус недавно получен от устройства, опрос пропущен")
+            else:
+                await skycooker.update()
+        finally:
+            next_poll["running"] = False
+        skycooker.async_publish_update()
+        if entry_data[DATA_WORKING]:
+            interval = get_poll_interval(skycooker.status, skycooker.status_code, scan_interval)
+            at = next_poll["at"] + interval
+            current = hass.loop.time()
+            if at <= current:
+                # Опрос занял больше интервала: пропускаем пропущенные слоты сетки
+                at += (math.floor((current - at) / interval) + 1) * interval
+            _LOGGER.debug(f"⏲️  Следующий опрос через {at - current:.1f} с (интервал {interval} с)")
+            schedule_poll_at(at)
+
+    return poll, schedule_poll, poll_now
+
+
+def _register_advertisement_callback(hass, entry, skycooker, poll_now) -> None:
+    """Подписка на объявления устройства.
+
+    Время последнего объявления и RSSI определяют доступность без подключения;
+    пока устройство не слышно, опросы откладываются, а вернувшееся устройство
+    опрашивается сразу.
+    """
+    mac = entry.data[CONF_MAC]
+
+    def on_advertisement(service_info, change) -> None:
+        if skycooker.on_advertisement(service_info.rssi):
+            _LOGGER.debug(f"📡 {mac} снова в эфире, внеочередной опрос")
+            skycooker.async_publish_update()
+            poll_now()
+
+    def on_unavailable(service_info) -> None:
+        _LOGGER.debug(f"📡 {mac} пропал из эфира")
+        skycooker.on_unavailable()
 
-    return poll, schedule_poll
+    try:
+        entry.async_on_unload(bluetooth.async_register_callback(
+            hass,
+            on_advertisement,
+            bluetooth.BluetoothCallbackMatcher(address=mac, connectable=True),
+            bluetooth.BluetoothScanningMode.PASSIVE,
+        ))
+        entry.async_on_unload(bluetooth.async_track_unavailable(hass, on_unavailable, mac, connectable=True))
+    except Exception as e:
+        _LOGGER.debug(f"💡 Подписка на объявления Bluetooth недоступна: {e}")
+        return
+    service_info = bluetooth.async_last_service_info(hass, mac, connectable=True)
+    skycooker.connection_manager.advertisements.activate(service_info.rssi if service_info else None)
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
@@ -102,7 +197,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     entry.async_on_unload(entry.add_update_listener(entry_update_listener))
 
     if DOMAIN not in hass.data: hass.data[DOMAIN] = {}
-    if entry.entry_id not in hass.data: hass.data[DOMAIN][entry.entry_id] = {}
+    if entry.entry_id not in hass.data[DOMAIN]: hass.data[DOMAIN][entry.entry_id] = {}
+    entry_data = hass.data[DOMAIN][entry.entry_id]
 
     # Load translations if not already loaded
     if "skycooker_translations" not in hass.data:
@@ -112,43 +208,65 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     model_name = entry.data.get(CONF_FRIENDLY_NAME, "")
     if model_name not in MODELS:
         _LOGGER.error(f"🚨 Модель {model_name} не поддерживается. Поддерживаемые модели: {list(MODELS.keys())}")
+        hass.data[DOMAIN].pop(entry.entry_id, None)
         return False
 
+    # Разносим подключения мультиварок во времени, чтобы они не занимали адаптер одновременно
+    start_delay = _get_start_delay(hass, entry)
+
 
     try:
+        # Версия ПО и возможности устройства из прошлых сессий: повторное подключение без лишних обменов
+        session_store = await async_get_session_store(hass)
         skycooker = SkyCookerConnection(
             mac=entry.data[CONF_MAC],
             key=entry.data[CONF_PASSWORD],
             persistent=entry.data[CONF_PERSISTENT_CONNECTION],
+            linger=entry.data.get(CONF_LINGER_TIME, DEFAULT_LINGER_TIME),
+            session_store=session_store,
+            connection_budget=get_connection_budget(hass),
             adapter=entry.data.get(CONF_DEVICE, None),
             hass=hass,
-            model_name=model_name
+            model_name=model_name,
+            dispatcher_signal=get_dispatcher_signal(entry.entry_id)
         )
-        hass.data[DOMAIN][entry.entry_id][DATA_CONNECTION] = skycooker
+        entry_data[DATA_CONNECTION] = skycooker
         
-        # Подключение и получение версии ПО во время начальной настройки
-        await skycooker.update()
-        _LOGGER.debug(f"📋 Версия ПО устройства: {skycooker.sw_version}")
+        # Подключение и получение версии ПО во время начальной настройки;
+        # отложенные входы не задерживают настройку - их первое подключение выполнит опрос
+        if start_delay:
+            _LOGGER.debug(f"⏲️  Подключение к {entry.data[CONF_MAC]} отложено на {start_delay} с")
+        else:
+            await skycooker.update()
+            _LOGGER.debug(f"📋 Версия ПО устройства: {skycooker.sw_version}")
     except Exception as e:
         if "не найдено" in str(e).lower() or "not found" in str(e).lower():
             _LOGGER.error(f"🚨 Устройство {entry.data[CONF_MAC]} не найдено. Проверьте, что устройство включено и находится в зоне действия Bluetooth.")
-            return False
         else:
             _LOGGER.error(f"🚨 Ошибка при настройке соединения: {e}")
-            return False
+        hass.data[DOMAIN].pop(entry.entry_id, None)
+        return False
 
-    poll, schedule_poll = _create_poll_scheduler(hass, entry, skycooker)
+    poll, schedule_poll, poll_now = _create_poll_scheduler(hass, entry, skycooker)
+    _register_advertisement_callback(hass, entry, skycooker, poll_now)
 
-    hass.data[DOMAIN][DATA_WORKING] = True
-    hass.data[DOMAIN][DATA_DEVICE_INFO] = lambda: device_info(entry, hass)
+    entry_data[DATA_WORKING] = True
+    entry_data[DATA_DEVICE_INFO] = lambda: device_info(entry, hass)
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    schedule_poll(timedelta(seconds=3))
+    schedule_poll(timedelta(seconds=start_delay or 3))
 
     return True
 
 
+def _get_start_delay(hass, entry) -> float:
+    """Задержка начального подключения для входа в зависимости от его позиции среди входов SkyCooker."""
+    entry_ids = [e.entry_id for e in hass.config_entries.async_entries(DOMAIN)]
+    index = entry_ids.index(entry.entry_id) if entry.entry_id in entry_ids else 0
+    return (index % STARTUP_STAGGER_SLOTS) * STARTUP_STAGGER
+
+
 def device_info(entry, hass):
     # Получение соединения SkyCooker для доступа к версии ПО
     skycooker = None
@@ -177,16 +295,23 @@ def device_info(entry, hass):
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Выгрузка конфигурационного входа."""
     _LOGGER.debug("🔄 Выгрузка")
-    hass.data[DOMAIN][DATA_WORKING] = False
-    for component in PLATFORMS:
-        hass.async_create_task(
-            hass.config_entries.async_forward_entry_unload(entry, component)
-        )
-    hass.data[DOMAIN][DATA_CANCEL]()
-    await hass.async_add_executor_job(hass.data[DOMAIN][entry.entry_id][DATA_CONNECTION].stop)
-    hass.data[DOMAIN][entry.entry_id][DATA_CONNECTION] = None
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    entry_data[DATA_WORKING] = False
+    if entry_data.get(DATA_CANCEL):
+        entry_data[DATA_CANCEL]()
+        entry_data[DATA_CANCEL] = None
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    await entry_data[DATA_CONNECTION].stop()
+    entry_data[DATA_CONNECTION] = None
+    hass.data[DOMAIN].pop(entry.entry_id, None)
     _LOGGER.debug("✅ Вход выгружен")
-    return True
+    return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Удаление входа: забываем сохраненную сессию устройства."""
+    session_store = await async_get_session_store(hass)
+    session_store.remove(entry.data[CONF_MAC])
 
 
 async def entry_update_listener(hass, entry):
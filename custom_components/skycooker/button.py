@@ -1,9 +1,7 @@
 """SkyCooker button entities."""
 import logging
-import asyncio
 
 from homeassistant.components.button import ButtonEntity
-from homeassistant.helpers.dispatcher import async_dispatcher_send
 
 from .const import *
 from .entity_base import SkyCookerEntity
@@ -31,6 +29,7 @@ class SkyCookerButton(SkyCookerEntity, ButtonEntity):
         """Инициализация сущности кнопки."""
         super().__init__(hass, entry)
         self.button_type = button_type
+        self.update_fields = frozenset()
 
     @property
     def unique_id(self):
@@ -69,12 +68,9 @@ class SkyCookerButton(SkyCookerEntity, ButtonEntity):
 
         try:
             if self.button_type in actions:
+                # Действие само применяет подтвержденное состояние устройства после команды
                 await actions[self.button_type]()
-                # Небольшая задержка перед обновлением состояния
-                await asyncio.sleep(0.5)
-                # Обновляем состояние после нажатия кнопки
-                await self.skycooker.update()
-                async_dispatcher_send(self.hass, DISPATCHER_UPDATE)
+                self.skycooker.async_publish_update()
         except SkyCookerError as e:
             _LOGGER.error(f"❌ Ошибка при нажатии кнопки: {str(e)}, {traceback.format_exception(e)}")
         except Exception as e:
@@ -13,8 +13,9 @@ from homeassistant.const import (CONF_DEVICE, CONF_FRIENDLY_NAME, CONF_MAC,
 from homeassistant.core import callback
 
 from .const import (
-    DOMAIN, CONF_PERSISTENT_CONNECTION, CONF_MODEL, CONF_FAVORITE_PROGRAMS,
-    DEFAULT_SCAN_INTERVAL, DEFAULT_PERSISTENT_CONNECTION, MAX_FAVORITE_PROGRAMS,
+    DOMAIN, CONF_PERSISTENT_CONNECTION, CONF_LINGER_TIME, CONF_MODEL, CONF_FAVORITE_PROGRAMS,
+    DEFAULT_SCAN_INTERVAL, DEFAULT_PERSISTENT_CONNECTION, DEFAULT_LINGER_TIME, MAX_LINGER_TIME,
+    MAX_FAVORITE_PROGRAMS,
     SKYCOOKER_NAME, MODEL_3
 )
 from . import load_translations
@@ -168,7 +169,8 @@ class SkyCookerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 )
                 tries = 3
                 while tries > 0 and not skycooker.last_connect_ok:
-                    await skycooker.update()
+                    # Проверка подключения не должна останавливаться автоматом защиты
+                    await skycooker.update(bypass_breaker=True)
                     tries -= 1
                  
                 connect_ok = getattr(skycooker, 'last_connect_ok', False)
@@ -241,6 +243,13 @@ class SkyCookerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 except (ValueError, KeyError) as e:
                     _LOGGER.error(f"Некорректное значение CONF_PERSISTENT_CONNECTION: {e}")
                     return self.async_abort(reason='invalid_input')
+
+                # Проверка и обработка CONF_LINGER_TIME
+                try:
+                    self.config[CONF_LINGER_TIME] = int(user_input.get(CONF_LINGER_TIME, DEFAULT_LINGER_TIME))
+                except (ValueError, TypeError) as e:
+                    _LOGGER.error(f"Некорректное значение CONF_LINGER_TIME: {e}")
+                    return self.async_abort(reason='invalid_input')
                   
                 # Сохранение избранных программ
                 if CONF_FAVORITE_PROGRAMS in user_input:
@@ -276,6 +285,10 @@ class SkyCookerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     CONF_PERSISTENT_CONNECTION,
                     default=self.config.get(CONF_PERSISTENT_CONNECTION, DEFAULT_PERSISTENT_CONNECTION)
                 ): cv.boolean,
+                vol.Required(
+                    CONF_LINGER_TIME,
+                    default=self.config.get(CONF_LINGER_TIME, DEFAULT_LINGER_TIME)
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=MAX_LINGER_TIME)),
                 vol.Required(
                     CONF_SCAN_INTERVAL,
                     default=self.config.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
@@ -7,14 +7,31 @@ LANGS = ["ru", "en"]
 
 # Константы для потока настройки
 CONF_PERSISTENT_CONNECTION = "persistent_connection"
+CONF_LINGER_TIME = "linger_time"
+CONF_MAX_CONNECTIONS = "max_connections"
 CONF_MODEL = "model"
 CONF_FAVORITE_PROGRAMS = "favorite_programs"
 
 # Значения по умолчанию
 DEFAULT_SCAN_INTERVAL = 30
 DEFAULT_PERSISTENT_CONNECTION = True
+DEFAULT_LINGER_TIME = 0
+MAX_LINGER_TIME = 600
 MAX_FAVORITE_PROGRAMS = 5
 
+# Адаптивный опрос
+POLL_INTERVAL_IDLE_FACTOR = 2
+# Предел редкого опроса выключенного устройства (секунды): запуск с панели мультиварки
+# без присылаемых статусов должен замечаться быстро
+POLL_INTERVAL_IDLE_MAX = 60
+POLL_INTERVAL_ACTIVE = 10
+POLL_INTERVAL_MIN = 5
+POLL_TRANSITION_MARGIN = 5
+
+# Разнесение начального подключения нескольких мультиварок (секунды, число слотов)
+STARTUP_STAGGER = 1.0
+STARTUP_STAGGER_SLOTS = 10
+
 # Дружественные имена
 FRIENDLY_NAME = "SkyCooker"
 SKYCOOKER_NAME = "SkyCooker"
@@ -54,20 +71,56 @@ UUID_SERVICE = "6e400001-b5a3-f393-e0a9-e50e24dcca9e"
 UUID_TX = "6e400002-b5a3-f393-e0a9-e50e24dcca9e"
 UUID_RX = "6e400003-b5a3-f393-e0a9-e50e24dcca9e"
 BLE_RECV_TIMEOUT = 1.5
+RESPONSE_QUARANTINE_SIZE = 16
+FRAME_START = 0x55
+FRAME_END = 0xAA
+FRAME_BUFFER_SIZE = 256
+MAX_FRAME_SIZE = 64
+FRAME_FLUSH_DELAY = 0.1
 MAX_TRIES = 3
 TRIES_INTERVAL = 0.5
+# Общий срок транзакции (подключение, аутентификация, команды и повторы), секунды
+TRANSACTION_TIMEOUT = 30
+CONNECT_MAX_ATTEMPTS = 5
+# Автомат защиты недоступного устройства: порог неудачных циклов опроса подряд (каждый - MAX_TRIES попыток),
+# базовая и максимальная пауза (секунды), доля случайного разброса паузы
+BREAKER_FAILURE_THRESHOLD = 3
+BREAKER_BASE_BACKOFF = 30
+BREAKER_MAX_BACKOFF = 900
+BREAKER_JITTER = 0.5
+# Устройство без объявлений дольше этого времени считается пропавшим из эфира (секунды)
+ADVERTISEMENT_WINDOW = 195
+# Максимальное ожидание слота соединения в очереди бюджета (секунды)
+CONNECTION_LEASE_TIMEOUT = 30
 STATS_INTERVAL = 15
 TARGET_TTL = 30
+# Максимальный возраст статуса, по которому можно не отправлять уже выполненные команды (секунды)
+STATUS_SNAPSHOT_MAX_AGE = 5
+
+# Кэш сессий устройств (версия ПО, возможности) в хранилище HA
+SESSION_STORE_KEY = "skycooker.sessions"
+SESSION_STORE_VERSION = 1
+SESSION_SAVE_DELAY = 10
+# Как часто перепроверять версию ПО знакомого устройства (секунды)
+VERSION_CHECK_INTERVAL = 7 * 24 * 3600
 
 # Ключи данных
 DATA_CONNECTION = "connection"
 DATA_CANCEL = "cancel"
 DATA_WORKING = "working"
 DATA_DEVICE_INFO = "device_info"
+DATA_PROGRAM_INDEX = "skycooker_program_index"
+DATA_SESSION_STORE = "skycooker_session_store"
+DATA_CONNECTION_BUDGET = "skycooker_connection_budget"
 
 # Диспетчер
 DISPATCHER_UPDATE = "update"
 
+# Псевдополя изменений, кроме полей Status, по которым сущности решают, нужно ли обновляться
+UPDATE_FIELD_TARGETS = "targets"
+UPDATE_FIELD_AVAILABLE = "available"
+UPDATE_FIELD_SUCCESS_RATE = "success_rate"
+
 # Команды
 COMMAND_GET_VERSION = 0x01
 COMMAND_TURN_ON = 0x03
@@ -79,6 +132,22 @@ COMMAND_SYNC_TIME = 0x6E
 COMMAND_GET_TIME = 0x6F
 COMMAND_AUTH = 0xFF
 
+# Команды, меняющие состояние устройства (после них статус перечитывается)
+STATE_COMMANDS = [COMMAND_TURN_ON, COMMAND_TURN_OFF, COMMAND_SET_MAIN_MODE, COMMAND_SELECT_PROGRAM]
+
+# Минимальная длина данных ответа для кода команды (для сборки кадров)
+RESPONSE_MIN_PAYLOAD = {
+    COMMAND_GET_VERSION: 2,
+    COMMAND_TURN_ON: 1,
+    COMMAND_TURN_OFF: 1,
+    COMMAND_SET_MAIN_MODE: 1,
+    COMMAND_GET_STATUS: 16,
+    COMMAND_SELECT_PROGRAM: 1,
+    COMMAND_SYNC_TIME: 1,
+    COMMAND_GET_TIME: 8,
+    COMMAND_AUTH: 1,
+}
+
 # Битовые флаги для настроек программ (uint8_t)
 # Битовые флаги для настроек программ
 BIT_FLAG_SUBMODE_ENABLE = 0x80        # B[7] - включение подрежима
@@ -1,29 +1,53 @@
 """Базовый класс для сущностей SkyCooker."""
 
+from homeassistant.core import callback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import Entity
 
-from .const import DISPATCHER_UPDATE, DOMAIN, DATA_CONNECTION, DATA_DEVICE_INFO
+from .const import DOMAIN, DATA_CONNECTION, DATA_DEVICE_INFO, UPDATE_FIELD_AVAILABLE
+from .utils import get_dispatcher_signal
 
 
 class SkyCookerEntity(Entity):
     """Базовый класс для сущностей SkyCooker."""
 
+    # Поля статуса и псевдополя, от которых зависит состояние сущности (None - от всех)
+    update_fields = None
+
     def __init__(self, hass, entry):
         """Инициализация сущности."""
         self.hass = hass
         self.entry = entry
+        self._write_scheduled = False
 
     async def async_added_to_hass(self):
             """Когда сущность добавлена в hass."""
-            self.update()
+            self._async_handle_update()
             self.async_on_remove(
-                async_dispatcher_connect(self.hass, DISPATCHER_UPDATE, self.update)
+                async_dispatcher_connect(self.hass, get_dispatcher_signal(self.entry.entry_id), self._async_handle_update)
             )
 
-    def update(self):
-        """Обновление сущности."""
-        self.schedule_update_ha_state()
+    @callback
+    def _async_handle_update(self, changed_fields=None):
+        """Обновление сущности, если изменились поля, от которых она зависит.
+
+        Запись состояния откладывается до конца текущей итерации цикла событий,
+        поэтому несколько обновлений подряд дают одну запись.
+        """
+        if changed_fields is not None and self.update_fields is not None:
+            if not changed_fields & (self.update_fields | {UPDATE_FIELD_AVAILABLE}):
+                return
+        if self._write_scheduled:
+            return
+        self._write_scheduled = True
+        self.hass.loop.call_soon(self._async_write_scheduled_state)
+
+    @callback
+    def _async_write_scheduled_state(self):
+        """Запись отложенного состояния сущности."""
+        self._write_scheduled = False
+        if self.hass is not None and self.entity_id:
+            self.async_write_ha_state()
 
     @property
     def skycooker(self):
@@ -33,7 +57,7 @@ class SkyCookerEntity(Entity):
     @property
     def device_info(self):
         """Возвращает информацию об устройстве."""
-        return self.hass.data[DOMAIN][DATA_DEVICE_INFO]()
+        return self.hass.data[DOMAIN][self.entry.entry_id][DATA_DEVICE_INFO]()
 
     @property
     def should_poll(self):
@@ -1,6 +1,7 @@
 """Модуль для работы с режимами SkyCooker."""
 import logging
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, List, Mapping, NamedTuple, Optional, Tuple
 
 from .const import *
 from .utils import get_localized_string
@@ -13,6 +14,71 @@ def _get_translations(hass: Any) -> dict:
     return hass.data.get("skycooker_translations", {}) if hass is not None else {}
 
 
+class ProgramIndex(NamedTuple):
+    """Неизменяемый индекс программ модели для текущего набора переводов."""
+    name_to_id: Mapping[str, int]
+    id_to_name: Mapping[int, str]
+    const_to_id: Mapping[str, int]
+    name_to_const: Mapping[str, str]
+    supported_names: FrozenSet[str]
+    options: Tuple[str, ...]
+
+
+def _build_program_index(hass: Any, model_id: int) -> ProgramIndex:
+    """Строит индекс программ модели по переводам."""
+    program_constants = get_program_constants(model_id)
+    program_names = _get_translations(hass).get("program_names", {})
+
+    first_index = {}
+    for idx, program_constant in enumerate(program_constants):
+        first_index.setdefault(program_constant, idx)
+    # При совпадении отображаемых названий побеждает последняя константа
+    name_to_const = {program_names.get(mc, ""): mc for mc in program_constants if mc}
+    name_to_id = {name: first_index[mc] for name, mc in name_to_const.items()}
+    const_to_id = {mc: first_index[mc] for mc in name_to_const.values()}
+
+    id_to_name = {}
+    for idx, program_constant in enumerate(program_constants):
+        if program_constant and program_constant != PROGRAM_NONE:
+            id_to_name[idx] = program_names.get(program_constant, f"Unknown ({idx})")
+        else:
+            id_to_name[idx] = f"Unknown ({idx})"
+
+    options = [program_names.get(PROGRAM_STANDBY, f"Unknown ({PROGRAM_STANDBY})")]
+    for program_constant in program_constants:
+        if program_constant and program_constant != PROGRAM_NONE and program_constant != PROGRAM_STANDBY:
+            options.append(program_names.get(program_constant, f"Unknown ({program_constant})"))
+
+    return ProgramIndex(
+        name_to_id=MappingProxyType(name_to_id),
+        id_to_name=MappingProxyType(id_to_name),
+        const_to_id=MappingProxyType(const_to_id),
+        name_to_const=MappingProxyType(name_to_const),
+        supported_names=frozenset(name_to_const),
+        options=tuple(options),
+    )
+
+
+def get_program_index(hass: Any, model_id: int) -> ProgramIndex:
+    """Возвращает индекс программ для (model_id, язык), строя его один раз.
+
+    Кэш хранится в hass.data и сбрасывается при загрузке переводов.
+    """
+    if hass is None:
+        return _build_program_index(hass, model_id)
+    cache = hass.data.setdefault(DATA_PROGRAM_INDEX, {})
+    key = (model_id, getattr(hass.config, "language", None))
+    index = cache.get(key)
+    if index is None:
+        index = cache[key] = _build_program_index(hass, model_id)
+    return index
+
+
+def invalidate_program_index(hass: Any) -> None:
+    """Сброс индексов программ (вызывается при смене набора переводов)."""
+    hass.data.pop(DATA_PROGRAM_INDEX, None)
+
+
 def get_program_data(model_id: int, program_id: int) -> Optional[Dict[str, Any]]:
     """Возвращает данные режима."""
     if model_id in PROGRAM_DATA and program_id < len(PROGRAM_DATA[model_id]):
@@ -30,28 +96,13 @@ def get_program_options(hass, model_id: int, include_standby: bool = True) -> Li
     if not program_constants or hass is None:
         return []
 
-    translations = _get_translations(hass)
-    program_names = translations.get("program_names", {})
-    if include_standby:
-        programs = [program_names.get(PROGRAM_STANDBY, f"Unknown ({PROGRAM_STANDBY})")]
-    else:
-        programs = []
-
-    # Добавляем режим ожидания в начало списка
-    for program_constant in program_constants:
-        if program_constant and program_constant != PROGRAM_NONE and program_constant != PROGRAM_STANDBY:
-            programs.append(program_names.get(program_constant, f"Unknown ({program_constant})"))
-
-    return programs
+    # Режим ожидания всегда первый в списке
+    options = get_program_index(hass, model_id).options
+    return list(options) if include_standby else list(options[1:])
 
 # option - текст в выбранном пункте селекта, а не число
 def get_constant_by_name(hass, program_name: str, model_id: int) -> Optional[str]:
-    program_id = find_program_id(hass, program_name, model_id)
-    program_constants = get_program_constants(model_id)
-    if not program_constants or program_id is None or program_id >= len(program_constants):
-        return None
-    
-    return program_constants[program_id]
+    return get_program_index(hass, model_id).name_to_const.get(program_name)
 
 def get_program_name_by_const(hass, const_name: str, model_id: int) -> Optional[str]:
     program_id = find_program_id_by_const(hass, const_name, model_id)
@@ -62,58 +113,27 @@ def get_program_name_by_const(hass, const_name: str, model_id: int) -> Optional[
 def get_standby_program_name(hass, model_id: int) -> Optional[str]:
     return get_program_name_by_const(hass, PROGRAM_STANDBY, model_id)
 
-def _find_program_index(program_constants: List[str], target_constant: str) -> Optional[int]:
-    """Возвращает индекс константы в списке режимов модели."""
-    for idx, mc in enumerate(program_constants):
-        if mc == target_constant:
-            return idx
-    return None
-
-
 def find_program_id(hass, program_name: str, model_id: int) -> Optional[int]:
     """Ищет идентификатор режима по названию."""
-    program_constants = get_program_constants(model_id)
-    if not program_constants:
-        return None
-
-    translations = _get_translations(hass)
-    program_names = translations.get("program_names", {})
-
-    program_constant_by_name = {program_names.get(mc, ""): mc for mc in program_constants if mc}
-    program_constant = program_constant_by_name.get(program_name)
-    if program_constant is None:
-        return None
-    return _find_program_index(program_constants, program_constant)
+    return get_program_index(hass, model_id).name_to_id.get(program_name)
 
 
 def find_program_id_by_const(hass, const_name: str, model_id: int) -> Optional[int]:
     """Ищет идентификатор режима по константе."""
-    program_constants = get_program_constants(model_id)
-    if not program_constants:
-        return None
+    return get_program_index(hass, model_id).const_to_id.get(const_name)
 
-    translations = _get_translations(hass)
-    program_names = translations.get("program_names", {})
 
-    program_constant_by_name = {program_names.get(mc, ""): mc for mc in program_constants if mc}
-    for display_name, program_constant in program_constant_by_name.items():
-        if program_constant == const_name:
-            return _find_program_index(program_constants, program_constant)
-    return None
+def get_program_id_by_const(model_id: int, const_name: str) -> Optional[int]:
+    """Ищет идентификатор режима по константе без учета переводов."""
+    program_constants = get_program_constants(model_id)
+    return program_constants.index(const_name) if const_name in program_constants else None
 
 
 def get_program_name(hass, program_id: int, model_id: int) -> str:
     """Возвращает название режима в зависимости от языка."""
-    program_constants = get_program_constants(model_id)
-    if model_id is None or not program_constants or program_id >= len(program_constants):
+    if model_id is None:
         return f"Unknown ({program_id})"
-    program_constant = program_constants[program_id]
-    if program_constant and program_constant != PROGRAM_NONE:
-        translations = _get_translations(hass)
-        program_names = translations.get("program_names", {})
-        return program_names.get(program_constant, f"Unknown ({program_id})")
-
-    return f"Unknown ({program_id})"
+    return get_program_index(hass, model_id).id_to_name.get(program_id, f"Unknown ({program_id})")
 
 
 def is_subprogram_supported(model_id: int) -> bool:
@@ -158,12 +178,10 @@ def get_favorite_programs(hass, entry, model_id: int) -> List[str]:
 
 def is_program_supported(hass, program_name: str, model_id: int) -> bool:
     """Проверяет, поддерживается ли режим устройством."""
-    program_const = get_constant_by_name(hass, program_name, model_id)
-    if program_const is None: return False
+    index = get_program_index(hass, model_id)
+    if program_name not in index.supported_names: return False
+    program_const = index.name_to_const[program_name]
     if model_id and model_id in PROGRAM_DATA:
-        if program_const not in PROGRAM_NAMES[model_id]:
-            _LOGGER.warning(f"⚠️  Режим {program_name} не поддерживается для модели {model_id}")
-            return False
         if program_const == PROGRAM_STANDBY:
             _LOGGER.debug(f"📋 Режим 16 (ожидание) - это допустимое состояние устройства, но его нельзя устанавливать напрямую")
         elif program_const == PROGRAM_NONE:
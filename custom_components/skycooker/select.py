@@ -6,14 +6,22 @@ from homeassistant.helpers.dispatcher import async_dispatcher_send
 
 from .const import *
 from .entity_base import SkyCookerEntity
-from .utils import (get_base_name, get_temperature_options, get_entity_name)
+from .utils import (get_base_name, get_temperature_options, get_entity_name, get_dispatcher_signal)
 from .time import get_time_options, _validate_hours, _validate_minutes
 from .programs import (get_favorite_programs, get_program_options,
                        is_subprogram_supported, find_program_id, get_subprogram_options, get_program_data,
-                       get_constant_by_name, get_standby_program_name)
+                       get_constant_by_name)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Поля, от которых зависит выбранный вариант: без целевого значения селект
+# показывает программу и температуру из статуса устройства
+_PROGRAM_FIELDS = frozenset({"is_on", "program_id", "subprogram_id", "program_name", UPDATE_FIELD_TARGETS})
+SELECT_UPDATE_FIELDS = {
+    SELECT_TYPE_PROGRAM: _PROGRAM_FIELDS,
+    SELECT_TYPE_FAVORITES: _PROGRAM_FIELDS,
+    SELECT_TYPE_TEMPERATURE: frozenset({"is_on", "target_temperature", UPDATE_FIELD_TARGETS}),
+}
 
 
 
@@ -48,6 +56,7 @@ class SkyCookerSelect(SkyCookerEntity, SelectEntity):
         """Инициализация сущности выбора."""
         super().__init__(hass, entry)
         self.select_type = select_type
+        self.update_fields = SELECT_UPDATE_FIELDS.get(select_type, frozenset({UPDATE_FIELD_TARGETS}))
 
     async def async_added_to_hass(self) -> None:
         """Вызывается при добавлении сущности в Home Assistant."""
@@ -81,7 +90,7 @@ class SkyCookerSelect(SkyCookerEntity, SelectEntity):
     async def _set_default_mode(self) -> None:
         """Установка программы ожидания по умолчанию для селекта программ приготовления."""
         # Находим программ ожидания для текущей модели.
-        self.skycooker.target_program_name = self._get_standby_program_name()
+        self.skycooker.target_program_id = self.skycooker.standby_program_id
         _LOGGER.debug(f"Установлена программа ожидания по умолчанию: mode_name={self.skycooker.target_program_name}")
 
     @property
@@ -185,6 +194,8 @@ class SkyCookerSelect(SkyCookerEntity, SelectEntity):
 
     async def async_select_option(self, option: str) -> None:
         """Изменение выбранного варианта."""
+        # Пользователь настраивает запуск: удерживаемое соединение не закрываем
+        self.skycooker.touch()
         if self.select_type == SELECT_TYPE_PROGRAM or self.select_type == SELECT_TYPE_FAVORITES:
             await self._handle_program_selection(option)
         elif self.select_type == SELECT_TYPE_TEMPERATURE:
@@ -209,12 +220,12 @@ class SkyCookerSelect(SkyCookerEntity, SelectEntity):
             if getattr(self.skycooker, 'target_additional_minutes', None) is None:
                 self.skycooker.target_additional_minutes = 0
          
-        self.async_schedule_update_ha_state(True)
+        self._async_handle_update()
           
         # Если это изменение программ, отправляем событие обновления для всех сущностей
         # чтобы обновить связанные селекты (время приготовления, температура и т.д.)
         if self.select_type == SELECT_TYPE_PROGRAM or self.select_type == SELECT_TYPE_FAVORITES:
-            async_dispatcher_send(self.hass, DISPATCHER_UPDATE)
+            async_dispatcher_send(self.hass, get_dispatcher_signal(self.entry.entry_id), {UPDATE_FIELD_TARGETS})
          
         return None
 
@@ -227,9 +238,9 @@ class SkyCookerSelect(SkyCookerEntity, SelectEntity):
         # Если выбрана пустая строка, не делаем ничего
         if not selected_program_name or selected_program_name == "":
             # Устанавливаем режим ожидания вместо пустого значения
-            self.skycooker.target_program_name = self._get_standby_program_name()
+            self.skycooker.target_program_id = self.skycooker.standby_program_id
             # Вызываем обновление состояния сущности
-            self.async_schedule_update_ha_state(True)
+            self._async_handle_update()
             return None
 
         program_constant = get_constant_by_name(self.hass, selected_program_name, model_id)
@@ -249,11 +260,8 @@ class SkyCookerSelect(SkyCookerEntity, SelectEntity):
             self.skycooker.target_temperature = program_data['temperature']
             self.skycooker.target_main_hours = _validate_hours(program_data['hours'])
             self.skycooker.target_main_minutes = _validate_minutes(program_data['minutes'])
-        # target_program_name - всегда "Название программы", не число и не константа!
-        self.skycooker.target_program_name = selected_program_name
+        # Название программы переводится в идентификатор здесь, контроллер хранит только идентификаторы
+        self.skycooker.target_program_id = program_id
         # Вызываем обновление для всех сущностей, чтобы немедленно обновить связанные селекты
-        async_dispatcher_send(self.hass, DISPATCHER_UPDATE)
+        async_dispatcher_send(self.hass, get_dispatcher_signal(self.entry.entry_id), {UPDATE_FIELD_TARGETS})
         return None
-
-    def _get_standby_program_name(self):
-        return get_standby_program_name(self.hass, self.skycooker.model_id)
\ No newline at end of file
@@ -15,6 +15,24 @@ from .programs import is_subprogram_supported
 from .status import get_status_text
 
 
+# Поля, от которых зависит состояние сенсора
+_TIME_FIELDS = frozenset({
+    "status", "is_on", "target_main_hours", "target_main_minutes",
+    "target_additional_hours", "target_additional_minutes", UPDATE_FIELD_TARGETS
+})
+SENSOR_UPDATE_FIELDS = {
+    SENSOR_TYPE_STATUS: frozenset({"status", "is_on"}),
+    SENSOR_TYPE_TEMPERATURE: frozenset({"status", "is_on", "target_temperature", UPDATE_FIELD_TARGETS}),
+    SENSOR_TYPE_REMAINING_TIME: _TIME_FIELDS,
+    SENSOR_TYPE_COOKING_TIME: _TIME_FIELDS,
+    SENSOR_TYPE_AUTO_WARM_TIME: _TIME_FIELDS,
+    SENSOR_TYPE_SUCCESS_RATE: frozenset({UPDATE_FIELD_SUCCESS_RATE}),
+    SENSOR_TYPE_DELAYED_LAUNCH_TIME: _TIME_FIELDS,
+    SENSOR_TYPE_CURRENT_PROGRAM: frozenset({"status", "is_on", "program_id", "program_name"}),
+    SENSOR_TYPE_SUBPROGRAM: frozenset({"subprogram_id"}),
+}
+
+
 async def async_setup_entry(hass, entry, async_add_entities):
     """Настройка сенсоров SkyCooker."""
     entities = [
@@ -43,6 +61,7 @@ class SkyCookerSensor(SkyCookerEntity, SensorEntity):
         """Инициализация сенсора."""
         super().__init__(hass, entry)
         self.sensor_type = sensor_type
+        self.update_fields = SENSOR_UPDATE_FIELDS.get(sensor_type)
 
     @property
     def unique_id(self):
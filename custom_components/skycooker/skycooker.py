@@ -4,7 +4,7 @@
 import logging
 from abc import ABC, abstractmethod
 from struct import pack, unpack
-from typing import Optional, Union, List
+from typing import Optional, Union, List, Tuple
 
 from .const import *
 from .programs import is_subprogram_supported
@@ -98,6 +98,14 @@ class SkyCooker(ABC):
             SkyCookerError: Если устройство не может быть включено.
         """
         r = await self.command(COMMAND_TURN_ON)
+        self.check_turn_on_response(r)
+
+    def check_turn_on_response(self, r: bytes) -> None:
+        """Проверка ответа на команду включения.
+        
+        Raises:
+            SkyCookerError: Если устройство не может быть включено.
+        """
         if r[0] != 1:
             raise SkyCookerError("can't turn on")
         _LOGGER.debug("Turned on")
@@ -113,15 +121,15 @@ class SkyCooker(ABC):
             raise SkyCookerError("can't turn off")
         _LOGGER.debug("Turned off")
 
-    async def select_program(self, program_id: int, subprog: int = 0) -> None:
-        """Выбор программы и подпрограммы для устройства SkyCooker.
+    def select_program_request(self, program_id: int, subprog: int = 0) -> Tuple[int, List[int]]:
+        """Формирование команды выбора программы.
         
         Args:
             program_id: Программа для выбора.
             subprog: Подпрограмма для выбора (по умолчанию 0).
             
-        Raises:
-            SkyCookerError: Если выбор программ не удался.
+        Returns:
+            Кортеж из кода команды и её параметров.
         """
         # Для MODEL_3 отправляем только mode (1 байт), для остальных - mode и subprog (2 байта)
         if is_subprogram_supported(self.model_id):
@@ -132,22 +140,42 @@ class SkyCooker(ABC):
             data = pack("B", int(program_id))
             _LOGGER.debug(f"📤 Отправка команды SELECT_MODE (0x09) для MODEL_3 с данными: {data.hex().upper()}")
             _LOGGER.debug(f"   Параметры: mode={program_id}")
+        return COMMAND_SELECT_PROGRAM, list(data)
 
+    def check_select_program_response(self, r: bytes) -> None:
+        """Проверка ответа на команду выбора программы.
+        
+        Raises:
+            SkyCookerError: Если устройство вернуло код ошибки.
+        """
+        _LOGGER.debug(f"📥 Получен ответ на SELECT_MODE: {r.hex().upper() if r else 'None'}")
+        if r and len(r) > 0:
+            _LOGGER.debug(f"   Первый байт ответа: {r[0]} (ожидалось 1 для успеха)")
+        # Accept both success code (0x01) and status updates as success
+        if r and r[0] != 1 and len(r) != 1:
+            _LOGGER.error(f"❌ Ошибка выбора режима: устройство вернуло код ошибки {r[0]}")
+            raise SkyCookerError(f"Ошибка выбора режима: код {r[0]}")
+
+    async def select_program(self, program_id: int, subprog: int = 0) -> None:
+        """Выбор программы и подпрограммы для устройства SkyCooker.
+        
+        Args:
+            program_id: Программа для выбора.
+            subprog: Подпрограмма для выбора (по умолчанию 0).
+            
+        Raises:
+            SkyCookerError: Если выбор программ не удался.
+        """
+        command, params = self.select_program_request(program_id, subprog)
         try:
-            r = await self.command(COMMAND_SELECT_PROGRAM, list(data))
-            _LOGGER.debug(f"📥 Получен ответ на SELECT_MODE: {r.hex().upper() if r else 'None'}")
-            if r and len(r) > 0:
-                _LOGGER.debug(f"   Первый байт ответа: {r[0]} (ожидалось 1 для успеха)")
-            # Accept both success code (0x01) and status updates as success
-            if r and r[0] != 1 and len(r) != 1:
-                _LOGGER.error(f"❌ Ошибка выбора режима: устройство вернуло код ошибки {r[0]}")
-                raise SkyCookerError(f"Ошибка выбора режима: код {r[0]}")
+            r = await self.command(command, params)
+            self.check_select_program_response(r)
             _LOGGER.debug(f"✅ Режим успешно выбран: mode={program_id}")
         except Exception as e:
             _LOGGER.error(f"❌ Исключение при выборе режима: {e}")
             raise SkyCookerError(f"Исключение при выборе режима: {e}")
 
-    async def set_main_program(
+    def set_main_program_request(
         self,
         program_id: int,
         subprogram_id: int = 0,
@@ -158,22 +186,11 @@ class SkyCooker(ABC):
         target_additional_minutes: int = 0,
         auto_warm: int = 0,
         bit_flags: int = 0
-    ) -> None:
-        """Установка основного программы и параметров для устройства SkyCooker.
+    ) -> Tuple[int, List[int]]:
+        """Формирование команды установки основной программы и параметров.
         
-        Args:
-            program_id: программа для установки.
-            subprogram_id: Подпрограмма для установки (по умолчанию 0).
-            target_temperature: Целевая температура (по умолчанию 0).
-            target_main_hours: Целевые часы (по умолчанию 0).
-            target_main_minutes: Целевые минуты (по умолчанию 0).
-            target_additional_hours: Целевые дополнительные часы (по умолчанию 0).
-            target_additional_minutes: Целевые дополнительные минуты (по умолчанию 0).
-            auto_warm: Настройка автоподогрева (по умолчанию 0).
-            bit_flags: Битовые флаги для настроек программ (по умолчанию 0).
-            
-        Raises:
-            SkyCookerError: Если установка программы не удалась.
+        Returns:
+            Кортеж из кода команды и её параметров.
         """
         # В текущей реализации битовые флаги берутся из MODE_DATA_NEW
         # Для MODEL_3 битовые флаги не добавляются
@@ -205,16 +222,57 @@ class SkyCooker(ABC):
             f"target_additional_hours={target_additional_hours}, target_additional_minutes={target_additional_minutes}, "
             f"auto_warm={auto_warm}, bit_flags={bit_flags}"
         )
+        return COMMAND_SET_MAIN_MODE, list(data)
+
+    def check_set_main_program_response(self, r: bytes) -> None:
+        """Проверка ответа на команду установки основной программы.
+        
+        Raises:
+            SkyCookerError: Если устройство вернуло код ошибки.
+        """
+        _LOGGER.debug(f"📥 Получен ответ на SET_MAIN_MODE: {r.hex().upper() if r else 'None'}")
+        if r and len(r) > 0:
+            _LOGGER.debug(f"   Первый байт ответа: {r[0]} (ожидалось 1 для успеха)")
+        # Accept both success code (0x01) and status updates as success
+        if r and r[0] != 1 and len(r) != 1:
+            _LOGGER.error(f"❌ Ошибка установки режима: устройство вернуло код ошибки {r[0]}")
+            raise SkyCookerError(f"Ошибка установки режима: код {r[0]}")
 
+    async def set_main_program(
+        self,
+        program_id: int,
+        subprogram_id: int = 0,
+        target_temperature: int = 0,
+        target_main_hours: int = 0,
+        target_main_minutes: int = 0,
+        target_additional_hours: int = 0,
+        target_additional_minutes: int = 0,
+        auto_warm: int = 0,
+        bit_flags: int = 0
+    ) -> None:
+        """Установка основного программы и параметров для устройства SkyCooker.
+        
+        Args:
+            program_id: программа для установки.
+            subprogram_id: Подпрограмма для установки (по умолчанию 0).
+            target_temperature: Целевая температура (по умолчанию 0).
+            target_main_hours: Целевые часы (по умолчанию 0).
+            target_main_minutes: Целевые минуты (по умолчанию 0).
+            target_additional_hours: Целевые дополнительные часы (по умолчанию 0).
+            target_additional_minutes: Целевые дополнительные минуты (по умолчанию 0).
+            auto_warm: Настройка автоподогрева (по умолчанию 0).
+            bit_flags: Битовые флаги для настроек программ (по умолчанию 0).
+            
+        Raises:
+            SkyCookerError: Если установка программы не удалась.
+        """
+        command, params = self.set_main_program_request(
+            program_id, subprogram_id, target_temperature, target_main_hours, target_main_minutes,
+            target_additional_hours, target_additional_minutes, auto_warm, bit_flags
+        )
         try:
-            r = await self.command(COMMAND_SET_MAIN_MODE, list(data))
-            _LOGGER.debug(f"📥 Получен ответ на SET_MAIN_MODE: {r.hex().upper() if r else 'None'}")
-            if r and len(r) > 0:
-                _LOGGER.debug(f"   Первый байт ответа: {r[0]} (ожидалось 1 для успеха)")
-            # Accept both success code (0x01) and status updates as success
-            if r and r[0] != 1 and len(r) != 1:
-                _LOGGER.error(f"❌ Ошибка установки режима: устройство вернуло код ошибки {r[0]}")
-                raise SkyCookerError(f"Ошибка установки режима: код {r[0]}")
+            r = await self.command(command, params)
+            self.check_set_main_program_response(r)
             _LOGGER.debug(f"✅ Режим успешно установлен: mode={program_id}")
         except Exception as e:
             _LOGGER.error(f"❌ Исключение при установке режима: {e}")
@@ -0,0 +1,73 @@
+#!/usr/local/bin/python3
+# coding: utf-8
+
+import logging
+from typing import Optional
+
+from .const import *
+from .skycooker_clock import SkyCookerClock
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SkyCookerAdvertisementMonitor:
+    """Присутствие мультиварки в эфире по объявлениям Bluetooth.
+
+    Хранит время последнего объявления и RSSI. Пока монитор не подключен к
+    объявлениям (нет стека Bluetooth HA, например в бенчмарках), устройство
+    считается присутствующим и опросы не ограничиваются.
+    """
+
+    def __init__(self, clock: SkyCookerClock) -> None:
+        self._clock = clock
+        self._active = False
+        self._last_seen: Optional[float] = None
+        self._rssi: Optional[int] = None
+        self._absent = False
+
+    def activate(self, rssi: Optional[int] = None) -> None:
+        """Начало отслеживания объявлений; окно присутствия отсчитывается с этого момента."""
+        self._active = True
+        self._last_seen = self._clock.monotonic()
+        self._rssi = rssi
+
+    def record(self, rssi: Optional[int] = None) -> bool:
+        """Учет объявления. Возвращает True, если устройство до этого отсутствовало в эфире."""
+        reappeared = self._active and not self.present
+        self._last_seen = self._clock.monotonic()
+        self._absent = False
+        if rssi is not None:
+            self._rssi = rssi
+        if reappeared:
+            _LOGGER.debug(f"📡 Устройство снова в эфире (RSSI {self._rssi})")
+        return reappeared
+
+    def mark_absent(self) -> None:
+        """Стек Bluetooth сообщил, что устройство пропало из эфира."""
+        self._absent = True
+
+    @property
+    def active(self) -> bool:
+        """Отслеживаются ли объявления."""
+        return self._active
+
+    @property
+    def present(self) -> bool:
+        """Слышно ли устройство в пределах окна ADVERTISEMENT_WINDOW."""
+        if not self._active:
+            return True
+        if self._absent or self._last_seen is None:
+            return False
+        return self._clock.monotonic() - self._last_seen <= ADVERTISEMENT_WINDOW
+
+    @property
+    def last_seen_age(self) -> Optional[float]:
+        """Секунд с последнего объявления."""
+        if self._last_seen is None:
+            return None
+        return self._clock.monotonic() - self._last_seen
+
+    @property
+    def rssi(self) -> Optional[int]:
+        """RSSI последнего объявления."""
+        return self._rssi
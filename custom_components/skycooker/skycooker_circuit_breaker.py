@@ -0,0 +1,101 @@
+#!/usr/local/bin/python3
+# coding: utf-8
+
+import logging
+import random
+from typing import Optional
+
+from .const import *
+from .skycooker_clock import SkyCookerClock
+
+_LOGGER = logging.getLogger(__name__)
+
+# Состояния автомата
+BREAKER_CLOSED = "closed"
+BREAKER_OPEN = "open"
+BREAKER_HALF_OPEN = "half_open"
+
+
+class SkyCookerCircuitBreaker:
+    """Автомат защиты от попыток подключения к недоступной мультиварке.
+
+    closed - опросы идут как обычно. После BREAKER_FAILURE_THRESHOLD неудачных циклов
+    опроса подряд (цикл - опрос со всеми повторами) автомат размыкается: опросы пропускаются на паузу,
+    растущую экспоненциально со случайным разбросом. По истечении паузы пропускается
+    одна пробная попытка (half_open): успех замыкает автомат, неудача снова
+    размыкает его с удвоенной паузой. Объявление устройства в эфире замыкает автомат сразу.
+    """
+
+    def __init__(self, clock: SkyCookerClock, rng: Optional[random.Random] = None) -> None:
+        self._clock = clock
+        self._rng = rng or random.Random()
+        self._state = BREAKER_CLOSED
+        self._opens = 0
+        self._failures = 0
+        self._last_failure_at: Optional[float] = None
+        self._retry_at: Optional[float] = None
+
+    def record_success(self) -> None:
+        """Учет успешного обмена с устройством."""
+        if self._state != BREAKER_CLOSED:
+            _LOGGER.info("✅ Связь с мультиваркой восстановлена, опросы возобновлены")
+        self._close()
+
+    def record_failure(self, started: float) -> None:
+        """Учет неудачного цикла опроса, начатого в момент started (monotonic).
+
+        Циклы, начатые до уже учтенной неудачи (объединенные с ней запросы статуса),
+        повторно не учитываются.
+        """
+        if self._last_failure_at is not None and started < self._last_failure_at:
+            return
+        self._last_failure_at = self._clock.monotonic()
+        if self._state == BREAKER_HALF_OPEN:
+            self._open()
+            return
+        self._failures += 1
+        if self._state == BREAKER_CLOSED and self._failures >= BREAKER_FAILURE_THRESHOLD:
+            self._open()
+
+    def allow_request(self) -> bool:
+        """Можно ли обращаться к устройству; по истечении паузы пропускает одну пробную попытку."""
+        if self._state == BREAKER_CLOSED:
+            return True
+        if self._state == BREAKER_OPEN and self._clock.monotonic() >= self._retry_at:
+            _LOGGER.debug("🔌 Пауза автомата истекла, пробная попытка подключения")
+            self._state = BREAKER_HALF_OPEN
+            return True
+        return False
+
+    def reset(self) -> None:
+        """Немедленное замыкание (устройство снова в эфире)."""
+        if self._state != BREAKER_CLOSED:
+            _LOGGER.debug("📡 Устройство снова в эфире, автомат замкнут")
+        self._close()
+
+    def _open(self) -> None:
+        self._opens += 1
+        self._failures = 0
+        backoff = min(BREAKER_MAX_BACKOFF, BREAKER_BASE_BACKOFF * 2 ** (self._opens - 1))
+        backoff *= 1 - BREAKER_JITTER * self._rng.random()
+        self._state = BREAKER_OPEN
+        self._retry_at = self._clock.monotonic() + backoff
+        _LOGGER.warning(f"⛔ Мультиварка недоступна, следующая попытка через {backoff:.0f} с")
+
+    def _close(self) -> None:
+        self._state = BREAKER_CLOSED
+        self._opens = 0
+        self._failures = 0
+        self._retry_at = None
+
+    @property
+    def state(self) -> str:
+        """Состояние автомата."""
+        return self._state
+
+    @property
+    def retry_in(self) -> Optional[float]:
+        """Секунд до следующей пробной попытки (None, если автомат не разомкнут)."""
+        if self._state != BREAKER_OPEN:
+            return None
+        return max(0.0, self._retry_at - self._clock.monotonic())
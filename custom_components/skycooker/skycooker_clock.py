@@ -0,0 +1,34 @@
+#!/usr/local/bin/python3
+# coding: utf-8
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+
+class SkyCookerClock:
+    """Источник времени и ожиданий для транспорта и логики мультиварки.
+
+    Все задержки, таймауты и отметки времени интеграции идут через этот объект,
+    поэтому тесты и бенчмарки могут подставить виртуальное время.
+    """
+
+    def monotonic(self) -> float:
+        """Монотонное время в секундах."""
+        return time.monotonic()
+
+    def time(self) -> float:
+        """Время UNIX в секундах (для отметок, переживающих перезапуск)."""
+        return time.time()
+
+    async def sleep(self, delay: float) -> None:
+        """Ожидание delay секунд."""
+        await asyncio.sleep(delay)
+
+    async def wait_for(self, awaitable: Awaitable[Any], timeout: Optional[float]) -> Any:
+        """Ожидание результата с таймаутом (asyncio.TimeoutError по истечении)."""
+        return await asyncio.wait_for(awaitable, timeout)
+
+    def call_later(self, delay: float, callback: Callable[..., Any], *args: Any) -> asyncio.TimerHandle:
+        """Отложенный вызов callback в цикле событий."""
+        return asyncio.get_running_loop().call_later(delay, callback, *args)
@@ -2,13 +2,18 @@
 # coding: utf-8
 
 import logging
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Awaitable, Callable, Dict, Set
+
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 
 from .const import *
 from .programs import find_program_id
 from .skycooker import SkyCooker
+from .skycooker_clock import SkyCookerClock
+from .skycooker_connection_budget import SkyCookerConnectionBudget
 from .skycooker_connection_manager import SkyCookerConnectionManager
 from .skycooker_cooking_controller import SkyCookerCookingController
+from .skycooker_session_store import SkyCookerSessionStore
 from .skycooker_state_manager import SkyCookerStateManager
 
 _LOGGER = logging.getLogger(__name__)
@@ -24,12 +29,54 @@ class SkyCookerConnection(SkyCooker):
         adapter: Optional[Any] = None,
         hass: Optional[Any] = None,
         model_name: Optional[str] = None,
+        dispatcher_signal: Optional[str] = None,
+        client_factory: Optional[Callable[[str], Awaitable[Any]]] = None,
+        clock: Optional[SkyCookerClock] = None,
+        linger: float = DEFAULT_LINGER_TIME,
+        session_store: Optional[SkyCookerSessionStore] = None,
+        connection_budget: Optional[SkyCookerConnectionBudget] = None,
     ) -> None:
         super().__init__(hass, model_name)
+        self.dispatcher_signal = dispatcher_signal
         # Инициализация компонентов
-        self.connection_manager = SkyCookerConnectionManager(mac, key, persistent, adapter, hass, model_name)
+        self.connection_manager = SkyCookerConnectionManager(
+            mac, key, persistent, adapter, hass, model_name,
+            client_factory=client_factory, clock=clock, linger=linger,
+            session_store=session_store, connection_budget=connection_budget
+        )
         self.cooking_controller = SkyCookerCookingController(self.connection_manager)
         self.state_manager = SkyCookerStateManager(self.connection_manager, self.cooking_controller)
+        self.connection_manager.set_status_listener(self._on_status_pushed)
+        self.cooking_controller.set_update_listener(self.async_dispatch_update)
+        self._published_available = None
+        self._published_success_rate = None
+
+    def _on_status_pushed(self, status: Status) -> None:
+        """Применение статуса, присланного устройством без запроса."""
+        self.cooking_controller.status = status
+        self.async_publish_update()
+
+    def pop_changed_fields(self) -> Set[str]:
+        """Возвращает поля, изменившиеся с последней публикации обновления."""
+        changed = self.cooking_controller.pop_changed_fields()
+        if self.available != self._published_available:
+            self._published_available = self.available
+            changed.add(UPDATE_FIELD_AVAILABLE)
+        if self.success_rate != self._published_success_rate:
+            self._published_success_rate = self.success_rate
+            changed.add(UPDATE_FIELD_SUCCESS_RATE)
+        return changed
+
+    def async_publish_update(self) -> None:
+        """Уведомление сущностей входа, только если что-то изменилось."""
+        changed = self.pop_changed_fields()
+        if changed:
+            self.async_dispatch_update(changed)
+
+    def async_dispatch_update(self, changed_fields: Optional[Set[str]] = None) -> None:
+        """Отправка сигнала обновления сущностям входа (None - обновить все)."""
+        if self.connection_manager.hass and self.dispatcher_signal:
+            async_dispatcher_send(self.connection_manager.hass, self.dispatcher_signal, changed_fields)
      
     # Делегирование методов к соответствующим компонентам
     
@@ -60,6 +107,22 @@ class SkyCookerConnection(SkyCooker):
     
     async def disconnect(self):
         await self.connection_manager.disconnect()
+
+    def touch(self) -> None:
+        self.connection_manager.touch()
+
+    def on_advertisement(self, rssi: Optional[int] = None) -> bool:
+        """Учет объявления устройства. Возвращает True, если устройство снова появилось в эфире."""
+        if not self.connection_manager.advertisements.record(rssi):
+            return False
+        # Вернувшееся устройство опрашивается сразу, без ожидания паузы автомата
+        self.connection_manager.breaker.reset()
+        return True
+
+    def on_unavailable(self) -> None:
+        """Стек Bluetooth сообщил, что устройство пропало из эфира."""
+        self.connection_manager.advertisements.mark_absent()
+        self.async_publish_update()
     
     async def _connect_if_need(self):
         # Заменим вызов защищенного метода на публичный
@@ -75,8 +138,9 @@ class SkyCookerConnection(SkyCooker):
         force_stats: bool = False,
         extra_action: Optional[Any] = None,
         commit: bool = False,
+        bypass_breaker: bool = False,
     ) -> Any:
-        return await self.state_manager.update(tries, force_stats, extra_action, commit)
+        return await self.state_manager.update(tries, force_stats, extra_action, commit, bypass_breaker=bypass_breaker)
     
     def add_stat(self, value):
         self.connection_manager.add_stat(value)
@@ -123,6 +187,18 @@ class SkyCookerConnection(SkyCooker):
     def target_temperature(self):
         return self.cooking_controller.target_temperature
     
+    @property
+    def target_program_id(self):
+        return self.cooking_controller.target_program_id
+
+    @target_program_id.setter
+    def target_program_id(self, value):
+        self.cooking_controller.target_program_id = value
+
+    @property
+    def standby_program_id(self):
+        return self.cooking_controller.standby_program_id
+
     @property
     def target_program_name(self):
         return self.cooking_controller.target_program_name
@@ -182,6 +258,18 @@ class SkyCookerConnection(SkyCooker):
     @property
     def connected(self):
         return self.connection_manager.connected
+
+    @property
+    def clock(self):
+        return self.connection_manager.clock
+
+    @property
+    def rssi(self):
+        return self.connection_manager.advertisements.rssi
+
+    @property
+    def status_push_age(self):
+        return self.connection_manager.status_push_age
     
     @property
     def auth_ok(self):
@@ -291,11 +379,15 @@ class SkyCookerConnection(SkyCooker):
     
     def _get_program_parameters(self, program_name: str) -> Any:
         # Заменим вызов защищенного метода на публичный
-        return self.cooking_controller.get_program_parameters(program_name)
+        program_id = find_program_id(self.hass, program_name, self.model_id)
+        return self.cooking_controller.get_program_parameters(program_id)
     
     async def set_target_program(self, program_name: str) -> None:
         await self.cooking_controller.set_target_program(program_name)
 
+    async def set_target_program_id(self, program_id: int) -> None:
+        await self.cooking_controller.set_target_program_id(program_id)
+
 
 class DisposedError(Exception):
     pass
\ No newline at end of file
@@ -0,0 +1,102 @@
+#!/usr/local/bin/python3
+# coding: utf-8
+
+import asyncio
+import heapq
+import itertools
+import logging
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .const import *
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SkyCookerConnectionBudget:
+    """Общий для всех мультиварок бюджет BLE соединений.
+
+    Перед подключением непостоянного соединения менеджер получает аренду слота
+    адаптера (или прокси), через который HA подключится к устройству, и возвращает
+    ее при отключении. Одновременно на адаптер выдается не больше limit аренд;
+    остальные ждут в очереди: действия пользователя раньше опросов, в пределах
+    одного приоритета - в порядке обращения. Появление ожидающего просит
+    владельцев простаивающих соединений освободить слот.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self._limit = limit
+        # Владельцы аренд адаптера и их обработчики просьбы освободить слот
+        self._holders: Dict[str, Dict[str, Optional[Callable[[], bool]]]] = {}
+        self._waiters: Dict[str, List[Tuple[int, int, str, asyncio.Future]]] = {}
+        self._counter = itertools.count()
+
+    @property
+    def limit(self) -> int:
+        """Максимум одновременных соединений на адаптер."""
+        return self._limit
+
+    async def acquire(
+        self,
+        key: str,
+        owner: str,
+        priority: int,
+        on_demand: Optional[Callable[[], bool]] = None
+    ) -> None:
+        """Получение аренды слота адаптера key для owner (ожидание в очереди при исчерпании).
+
+        on_demand вызывается, когда слот понадобился другому ожидающему, и возвращает
+        True, если владелец освободит слот.
+        """
+        holders = self._holders.setdefault(key, {})
+        if owner in holders:
+            return
+        waiters = self._waiters.setdefault(key, [])
+        if len(holders) < self._limit and not waiters:
+            holders[owner] = on_demand
+            return
+        waiter = (priority, next(self._counter), owner, asyncio.get_running_loop().create_future())
+        heapq.heappush(waiters, waiter)
+        _LOGGER.debug(f"⏳ {owner} ждет слот соединения {key or 'адаптера'} ({len(holders)}/{self._limit} занято, в очереди {len(waiters)})")
+        # Освободить слот просится один простаивающий владелец на каждого ожидающего
+        for callback in list(holders.values()):
+            if callback and callback():
+                break
+        try:
+            await waiter[3]
+        except BaseException:
+            if waiter[3].done() and not waiter[3].cancelled():
+                # Слот выдан одновременно с отменой ожидания
+                self.release(key, owner)
+            elif waiter in waiters:
+                waiters.remove(waiter)
+                heapq.heapify(waiters)
+            raise
+        holders[owner] = on_demand
+
+    def release(self, key: str, owner: str) -> None:
+        """Возврат аренды и выдача слота следующему в очереди."""
+        holders = self._holders.get(key)
+        if not holders or owner not in holders:
+            return
+        del holders[owner]
+        waiters = self._waiters.get(key, [])
+        while waiters and len(holders) < self._limit:
+            _, _, next_owner, future = heapq.heappop(waiters)
+            if future.done():
+                continue
+            # Слот занимается сразу, обработчик запоминается после пробуждения ожидающего
+            holders[next_owner] = None
+            future.set_result(None)
+
+    def has_waiters(self, key: str) -> bool:
+        """Есть ли ожидающие слота адаптера."""
+        return any(not future.done() for _, _, _, future in self._waiters.get(key, ()))
+
+    def in_use(self, key: str) -> int:
+        """Число выданных аренд адаптера."""
+        return len(self._holders.get(key, ()))
+
+
+def get_connection_budget(hass) -> Optional[SkyCookerConnectionBudget]:
+    """Бюджет соединений интеграции (None, если лимит не задан в configuration.yaml)."""
+    return hass.data.get(DATA_CONNECTION_BUDGET)
@@ -3,16 +3,23 @@
 
 import asyncio
 import logging
-from time import monotonic
-from typing import Optional, List, Any
+from collections import deque
+from typing import Optional, List, Any, Awaitable, Callable, Deque, Dict, Tuple
 
 from bleak_retry_connector import establish_connection, BleakClientWithServiceCache
 
 from homeassistant.components import bluetooth
 
 from .const import *
-from .skycooker import SkyCooker
-from .status import get_status
+from .skycooker import SkyCooker, SkyCookerError
+from .skycooker_advertisement_monitor import SkyCookerAdvertisementMonitor
+from .skycooker_circuit_breaker import BREAKER_CLOSED, SkyCookerCircuitBreaker
+from .skycooker_clock import SkyCookerClock
+from .skycooker_connection_budget import SkyCookerConnectionBudget
+from .skycooker_frame_parser import SkyCookerFrameParser
+from .skycooker_link_actor import PRIORITY_POLL, PRIORITY_USER, DisposedError, SkyCookerLinkActor
+from .skycooker_session_store import SkyCookerSessionStore
+from .status import get_status, parse_status
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,7 +34,12 @@ class SkyCookerConnectionManager(SkyCooker):
         persistent: bool = True,
         adapter: Optional[Any] = None,
         hass: Optional[Any] = None,
-        model_name: Optional[str] = None
+        model_name: Optional[str] = None,
+        client_factory: Optional[Callable[[str], Awaitable[Any]]] = None,
+        clock: Optional[SkyCookerClock] = None,
+        linger: float = DEFAULT_LINGER_TIME,
+        session_store: Optional[SkyCookerSessionStore] = None,
+        connection_budget: Optional[SkyCookerConnectionBudget] = None
     ) -> None:
         # Инициализация базового класса SkyCooker
         super().__init__(hass, model_name)
@@ -37,57 +49,201 @@ class SkyCookerConnectionManager(SkyCooker):
         self._mac_address = mac_address
         self._key = key
         self._persistent = persistent
+        # Окно удержания непостоянного соединения после последней активности (0 - отключаться сразу)
+        self._linger = linger
+        self._linger_handle: Optional[asyncio.TimerHandle] = None
+        self._linger_task: Optional[asyncio.Task] = None
         self._adapter = adapter
         self._hass = hass
+        # Общий бюджет соединений: аренда слота адаптера на время непостоянного соединения
+        # (постоянное соединение занимает слот всегда и в бюджете не учитывается)
+        self._budget = None if persistent else connection_budget
+        self._lease_key: Optional[str] = None
+        # Фабрика GATT клиента по MAC адресу (симулятор устройства), по умолчанию - bleak
+        self._client_factory = client_factory
+        # Источник времени и ожиданий (подменяется виртуальным временем в тестах и бенчмарках)
+        self._clock = clock or SkyCookerClock()
         self._auth_ok = False
-        self._sw_version = '0.0'
+        # Данные сессии устройства (версия ПО, возможности), переживающие переподключения и перезапуски
+        self._session_store = session_store
+        self._session: Dict[str, Any] = session_store.get(mac_address) if session_store else {}
+        if self._session.get("model") != model_name:
+            self._session = {}
+        # Ответ на AUTH, отправленную без ожидания; проверяется вместе с первой командой
+        self._pending_auth: Optional[Tuple[int, asyncio.Future]] = None
+        self._sw_version = self._session.get("sw_version", '0.0')
         self._iter = 0
-        self._update_lock = asyncio.Lock()
+        # Задача, через которую проходят все обмены с устройством
+        self._link = SkyCookerLinkActor(mac_address)
         self._last_set_target = 0
         self._last_connect_ok = False
         self._last_auth_ok = False
+        self._auth_rejected = False
         self._successes: List[bool] = []
+        # Автомат защиты: приостанавливает опросы недоступного устройства
+        self._breaker = SkyCookerCircuitBreaker(self._clock)
+        # Присутствие в эфире по объявлениям Bluetooth
+        self._advertisements = SkyCookerAdvertisementMonitor(self._clock)
         self._disposed = False
-        self._last_data: Optional[bytes] = None
+        # Ожидающие ответа запросы по идентификатору (_iter) и карантин истекших идентификаторов
+        self._pending: Dict[int, Tuple[int, asyncio.Future]] = {}
+        self._quarantine: Deque[int] = deque(maxlen=RESPONSE_QUARANTINE_SIZE)
+        self._frame_parser = SkyCookerFrameParser()
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._status_listener: Optional[Callable[[Status], None]] = None
+        self._last_push_time: Optional[float] = None
+        self._last_push_status: Optional[Status] = None
+        # Время последней записи команды, меняющей состояние (для чтения после записи)
+        self._last_command_time: Optional[float] = None
     
     async def command(self, command: int, params: Optional[List[int]] = None) -> bytes:
         """Отправка команды устройству через BLE."""
+        iter_id, future = await self._send(command, params)
+        if self._pending_auth is None:
+            return await self._receive(command, iter_id, future)
+        # Первая команда после AUTH без ожидания: сначала проверяется ответ на AUTH
+        try:
+            await self._confirm_pending_auth()
+        except BaseException:
+            self._expire_request(iter_id)
+            raise
+        try:
+            r = await self._receive(command, iter_id, future)
+        except IOError:
+            if self._session.get("pipelined_auth") is not False:
+                _LOGGER.debug("💡 Нет ответа на команду сразу за AUTH, далее AUTH выполняется отдельным обменом")
+                self._update_session(pipelined_auth=False)
+            raise
+        if not self._session.get("pipelined_auth"):
+            self._update_session(pipelined_auth=True)
+        return r
+
+    async def _confirm_pending_auth(self) -> None:
+        """Проверка ответа на AUTH, отправленную без ожидания."""
+        iter_id, future = self._pending_auth
+        self._pending_auth = None
+        try:
+            r = await self._receive(COMMAND_AUTH, iter_id, future)
+        except BaseException:
+            self._auth_ok = False
+            raise
+        self._last_auth_ok = self._auth_ok = r[0] != 0
+        self._auth_rejected = not self._auth_ok
+        _LOGGER.debug(f"Auth: ok={self._auth_ok}")
+        if not self._auth_ok:
+            _LOGGER.error("🚫 Ошибка аутентификации. Необходимо включить режим сопряжения на мультиварке.")
+            raise AuthError("Ошибка аутентификации")
+
+    def _update_session(self, **fields: Any) -> None:
+        """Обновление данных сессии устройства и их сохранение в кэше."""
+        self._session.update(fields, model=self.model_name)
+        if self._session_store:
+            self._session_store.update(self._mac_address, self._session)
+
+    def _use_pipelined_auth(self) -> bool:
+        """Можно ли отправить AUTH без ожидания ответа (устройство знакомо и прошивка это принимает)."""
+        pipelined = self._session.get("pipelined_auth")
+        if pipelined is None:
+            return "sw_version" in self._session
+        return pipelined
+
+    def _version_check_due(self) -> bool:
+        """Нужен ли запрос версии ПО: первый контакт или истек интервал перепроверки."""
+        if "sw_version" not in self._session:
+            return True
+        return self._clock.time() - self._session.get("version_checked", 0) > VERSION_CHECK_INTERVAL
+
+    async def transaction(
+        self,
+        action: Callable[[], Awaitable[Any]],
+        priority: int = PRIORITY_USER,
+        timeout: float = TRANSACTION_TIMEOUT,
+        tries: int = MAX_TRIES
+    ) -> Any:
+        """Выполнение последовательности команд как одного целого.
+
+        Подключение при необходимости, аутентификация, команды action и отключение
+        при непостоянном соединении выполняются задачей соединения без перерыва,
+        поэтому другие обмены не вклиниваются между командами. На всю транзакцию
+        действует один срок timeout; при ошибке связи она повторяется целиком,
+        пока остаются попытки и время. Отказ устройства (SkyCookerError) и ошибка
+        аутентификации не повторяются.
+        """
+        deadline = self._clock.monotonic() + timeout
+
+        async def attempt() -> Any:
+            remaining = max(0.0, deadline - self._clock.monotonic())
+            return await self._clock.wait_for(self._run_transaction(action), remaining)
+
+        for attempt_number in range(1, tries + 1):
+            try:
+                return await self._link.run(attempt, priority)
+            except (AuthError, DisposedError, SkyCookerError):
+                raise
+            except Exception as e:
+                if self._disposed or attempt_number == tries or deadline - self._clock.monotonic() <= TRIES_INTERVAL:
+                    _LOGGER.warning(f"⚠️  Транзакция не выполнена за {attempt_number} попыток: {type(e).__name__}: {e}")
+                    raise
+                _LOGGER.debug(f"🚫 {type(e).__name__}: {e}, повтор транзакции #{attempt_number}")
+                # Пауза между попытками вне задачи соединения: ожидающие запросы выполняются в ней
+                await self._clock.sleep(TRIES_INTERVAL)
+
+    async def _run_transaction(self, action: Callable[[], Awaitable[Any]]) -> Any:
+        """Одна попытка транзакции; выполняется задачей соединения."""
+        try:
+            await self._connect_if_need()
+            result = await action()
+        except BaseException:
+            # Соединение в неизвестном состоянии: следующая попытка начинается с нового
+            await self.disconnect()
+            raise
+        await self._disconnect_if_need()
+        return result
+
+    def _next_iter(self) -> int:
+        """Выделение свободного идентификатора запроса (не ожидающего и не в карантине)."""
+        for _ in range(256):
+            self._iter = (self._iter + 1) % 256
+            if self._iter not in self._pending and self._iter not in self._quarantine:
+                return self._iter
+        raise IOError("Нет свободных идентификаторов запроса")
+
+    async def _send(self, command: int, params: Optional[List[int]] = None) -> Tuple[int, asyncio.Future]:
+        """Запись кадра команды и регистрация Future для его идентификатора."""
         if params is None:
             params = []
         if self._disposed:
             raise DisposedError()
         if not self._client or not self._client.is_connected:
             raise IOError("🔌 Не подключено")
-        self._iter = (self._iter + 1) % 256
+        iter_id = self._next_iter()
         _LOGGER.debug(f"📤 Отправка команды {command:02x}, данные: [{' '.join([f'{c:02x}' for c in params])}]")
-        data = bytes([0x55, self._iter, command] + list(params) + [0xAA])
-        self._last_data = None
+        data = bytes([0x55, iter_id, command] + list(params) + [0xAA])
+        # Future регистрируется до записи, чтобы не потерять быстрый ответ
+        future = asyncio.get_running_loop().create_future()
+        self._pending[iter_id] = (command, future)
         try:
+            if command in STATE_COMMANDS:
+                self._last_command_time = self._clock.monotonic()
             await self._client.write_gatt_char(UUID_TX, data)
             _LOGGER.debug(f"📋 Отправленный пакет: {data.hex().upper()}")
         except Exception as e:
+            self._pending.pop(iter_id, None)
             _LOGGER.error(f"🚫 Ошибка отправки команды: {e}")
             raise IOError(f"Ошибка отправки команды: {e}")
-        timeout_time = monotonic() + BLE_RECV_TIMEOUT
-        while True:
-            await asyncio.sleep(0.05)
-            if self._last_data:
-                r = self._last_data
-                _LOGGER.debug(f"📥 Получен сырой ответ: {r.hex().upper()}")
-                if len(r) < 4 or r[0] != 0x55 or r[-1] != 0xAA:
-                    _LOGGER.error(f"❌ Некорректный формат ответа: {r.hex().upper()}")
-                    raise IOError("Некорректный формат ответа")
-                if r[1] == self._iter:
-                    _LOGGER.debug(f"✅ Правильный идентификатор запроса {self._iter} в ответе")
-                    break
-                else:
-                    _LOGGER.warning(f"⚠️  Неправильный идентификатор запроса в ответе: ожидалось {self._iter}, получено {r[1]}")
-                    _LOGGER.warning(f"💡 Это может быть ответ на предыдущий запрос или от другого устройства")
-                    self._last_data = None
-            if monotonic() >= timeout_time:
-                _LOGGER.error(f"⏱️  Таймаут приема ответа на команду {command:02x}")
-                raise IOError("Таймаут приема")
-         
+        return iter_id, future
+
+    async def _receive(self, command: int, iter_id: int, future: asyncio.Future) -> bytes:
+        """Ожидание ответа для идентификатора запроса и его проверка."""
+        try:
+            r = await self._clock.wait_for(future, BLE_RECV_TIMEOUT)
+        except asyncio.TimeoutError:
+            self._expire_request(iter_id)
+            _LOGGER.error(f"⏱️  Таймаут приема ответа на команду {command:02x}")
+            raise IOError("Таймаут приема")
+        finally:
+            self._pending.pop(iter_id, None)
+
         # Check if the response command matches the expected command
         if r[2] != command:
             return self._handle_unexpected_command_response(command, r)
@@ -96,9 +252,105 @@ class SkyCookerConnectionManager(SkyCooker):
         _LOGGER.debug(f"📥 Очищенные данные ответа: {' '.join([f'{c:02x}' for c in clean])}")
         return clean
 
+    def _expire_request(self, iter_id: int) -> None:
+        """Перевод идентификатора истекшего запроса в карантин."""
+        self._pending.pop(iter_id, None)
+        if iter_id not in self._quarantine:
+            self._quarantine.append(iter_id)
+
     def _rx_callback(self, sender: Any, data: bytes) -> None:
-        """Callback для обработки входящих данных."""
-        self._last_data = data
+        """Callback для обработки входящих данных.
+
+        Уведомление может содержать часть кадра или несколько кадров сразу,
+        поэтому данные проходят через потоковый сборщик кадров.
+        """
+        _LOGGER.debug(f"📥 Получены сырые данные: {bytes(data).hex().upper()}")
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        for frame in self._frame_parser.feed(data):
+            self._handle_frame(frame)
+        if self._frame_parser.has_partial_frame:
+            self._flush_handle = self._clock.call_later(FRAME_FLUSH_DELAY, self._flush_frames)
+
+    def _flush_frames(self) -> None:
+        """Выдача накопленного кадра после паузы в уведомлениях."""
+        self._flush_handle = None
+        for frame in self._frame_parser.flush():
+            self._handle_frame(frame)
+
+    def _handle_frame(self, r: bytes) -> None:
+        """Обработка собранного кадра.
+
+        Завершает Future, зарегистрированный для идентификатора запроса из ответа.
+        Поздние ответы на истекшие запросы отбрасываются.
+        """
+        _LOGGER.debug(f"📥 Получен сырой ответ: {r.hex().upper()}")
+        iter_id = r[1]
+        command, future = self._pending.get(iter_id, (None, None))
+        if future is not None and not future.done():
+            _LOGGER.debug(f"✅ Правильный идентификатор запроса {iter_id} в ответе")
+            future.set_result(r)
+            # Статус вместо подтверждения команды тоже содержит актуальное состояние
+            if r[2] == COMMAND_GET_STATUS and command != COMMAND_GET_STATUS:
+                self._push_status(r)
+            return
+        if iter_id in self._quarantine:
+            _LOGGER.debug(f"🗑️  Поздний ответ на истекший запрос {iter_id} отброшен: {r.hex().upper()}")
+            return
+        if r[2] == COMMAND_GET_STATUS:
+            _LOGGER.debug(f"📡 Получено самостоятельное уведомление о статусе: {r.hex().upper()}")
+            self._push_status(r)
+            return
+        _LOGGER.warning(f"⚠️  Ответ с неизвестным идентификатором запроса {iter_id}: {r.hex().upper()}")
+        _LOGGER.warning(f"💡 Это может быть ответ на предыдущий запрос или от другого устройства")
+
+    def _push_status(self, r: bytes) -> None:
+        """Разбор статуса из уведомления 0x06 и передача его слушателю."""
+        data = bytes(r[3:-1])
+        if len(data) < RESPONSE_MIN_PAYLOAD[COMMAND_GET_STATUS]:
+            _LOGGER.debug(f"💡 Уведомление 0x06 без полного статуса: {data.hex().upper()}")
+            return
+        try:
+            status = parse_status(self._hass, self.model_id, data)
+        except Exception as e:
+            _LOGGER.warning(f"⚠️  Не удалось разобрать уведомление о статусе: {e}")
+            return
+        self._last_push_time = self._clock.monotonic()
+        self._last_push_status = status
+        if self._status_listener:
+            self._status_listener(status)
+
+    async def read_after_write(self) -> Status:
+        """Подтвержденное состояние после последней команды.
+
+        Если после записи команды устройство уже прислало статус (0x06 вместо
+        подтверждения или уведомление), он возвращается без обмена; иначе
+        выполняется один запрос GET_STATUS.
+        """
+        if (self._last_push_status is not None and self._last_command_time is not None
+                and self._last_push_time >= self._last_command_time):
+            _LOGGER.debug("📡 Состояние после команды уже прислано устройством")
+            return self._last_push_status
+        return await self.get_status()
+
+    def set_status_listener(self, listener: Optional[Callable[[Status], None]]) -> None:
+        """Установка обработчика статусов, присланных устройством без запроса."""
+        self._status_listener = listener
+
+    @property
+    def status_push_age(self) -> float:
+        """Сколько секунд прошло с последнего статуса, присланного устройством."""
+        if self._last_push_time is None:
+            return float("inf")
+        return self._clock.monotonic() - self._last_push_time
+
+    def _reset_frame_parser(self) -> None:
+        """Сброс сборщика кадров и отложенной выдачи."""
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._frame_parser.reset()
 
     def _handle_unexpected_command_response(self, command: int, r: bytes) -> bytes:
         """Обработка неожиданной команды в ответе. Возвращает данные или выбрасывает IOError."""
@@ -130,19 +382,28 @@ class SkyCookerConnectionManager(SkyCooker):
             # Очистка предыдущих подключений
             await self._cleanup_previous_connections()
             
-            self._device = bluetooth.async_ble_device_from_address(self._hass, self._mac_address)
-            if not self._device:
-                _LOGGER.error("❌ Устройство %s не найдено", self._mac_address)
-                raise IOError(f"Устройство {self._mac_address} не найдено")
-            _LOGGER.debug("🔌 Подключение к мультиварке %s (%s)...", self._mac_address, self._device.name)
-            self._client = await establish_connection(
-                BleakClientWithServiceCache,
-                self._device,
-                self._device.name or "Unknown Device",
-                max_attempts=5,
-                retry_interval=1.0
-            )
+            if self._client_factory:
+                await self._acquire_lease(self._adapter or "")
+                _LOGGER.debug("🔌 Подключение к мультиварке %s через фабрику клиента...", self._mac_address)
+                self._client = await self._client_factory(self._mac_address)
+            else:
+                self._device = bluetooth.async_ble_device_from_address(self._hass, self._mac_address)
+                if not self._device:
+                    _LOGGER.error("❌ Устройство %s не найдено", self._mac_address)
+                    raise IOError(f"Устройство {self._mac_address} не найдено")
+                await self._acquire_lease(self._device_source(self._device))
+                _LOGGER.debug("🔌 Подключение к мультиварке %s (%s)...", self._mac_address, self._device.name)
+                # Адаптер или прокси выбирает клиент Bluetooth HA (по RSSI и свободным слотам)
+                self._client = await establish_connection(
+                    BleakClientWithServiceCache,
+                    self._device,
+                    self._device.name or "Unknown Device",
+                    # Пробная попытка после паузы автомата - одна, без серии переподключений
+                    max_attempts=CONNECT_MAX_ATTEMPTS if self._breaker.state == BREAKER_CLOSED else 1,
+                    retry_interval=1.0
+                )
             _LOGGER.debug("✅ Успешно подключено к мультиварке %s", self._mac_address)
+            self._reset_frame_parser()
             await self._client.start_notify(UUID_RX, self._rx_callback)
             _LOGGER.debug("📡 Подписка на уведомления от мультиварки")
         except Exception as e:
@@ -180,9 +441,24 @@ class SkyCookerConnectionManager(SkyCooker):
                 await self._client.disconnect()
                 if was_connected: _LOGGER.debug("Disconnected")
         finally:
+            self._cancel_linger()
+            self._release_lease()
+            if self._pending_auth is not None:
+                # Ответ на AUTH без ожидания больше никто не проверит
+                self._pending_auth[1].cancel()
+            self._pending_auth = None
             self._auth_ok = False
             self._device = None
             self._client = None
+            self._reset_frame_parser()
+            self._fail_pending(IOError("Соединение закрыто"))
+
+    def _fail_pending(self, exc: Exception) -> None:
+        """Завершение всех ожидающих запросов исключением."""
+        for iter_id, (_, future) in list(self._pending.items()):
+            if not future.done():
+                future.set_exception(exc)
+            self._expire_request(iter_id)
 
     async def disconnect(self) -> None:
         """Публичный метод отключения."""
@@ -228,6 +504,8 @@ class SkyCookerConnectionManager(SkyCooker):
 
     async def _connect_if_need(self) -> None:
         """Подключение при необходимости."""
+        # Соединение снова используется: окно удержания отсчитывается после обмена
+        self._cancel_linger()
         if self._client and not self._client.is_connected:
             _LOGGER.warning("⚠️  Подключение к мультиварке потеряно")
             await self.disconnect()
@@ -240,19 +518,102 @@ class SkyCookerConnectionManager(SkyCooker):
                 self._last_connect_ok = False
                 _LOGGER.error(f"🚫 Ошибка подключения к мультиварке: {ex}")
                 raise ex
-        if not self._auth_ok:
-            self._last_auth_ok = self._auth_ok = await self.auth(self._key)
-            if not self._auth_ok:
-                _LOGGER.error("🚫 Ошибка аутентификации. Необходимо включить режим сопряжения на мультиварке.")
-                raise AuthError("Ошибка аутентификации")
-            _LOGGER.debug("✅ Аутентификация успешна")
-            self._sw_version = await self.get_version()
-            _LOGGER.debug(f"📋 Версия ПО: {self._sw_version}")
+        if not self._auth_ok and self._pending_auth is None:
+            if self._use_pipelined_auth():
+                # Ответ на AUTH проверит первая команда: отдельного обмена нет,
+                # _auth_ok устанавливается только после подтверждения
+                _LOGGER.debug("📤 AUTH отправляется без ожидания ответа")
+                self._pending_auth = await self._send(COMMAND_AUTH, self._key)
+            else:
+                self._last_auth_ok = self._auth_ok = await self.auth(self._key)
+                self._auth_rejected = not self._auth_ok
+                if not self._auth_ok:
+                    _LOGGER.error("🚫 Ошибка аутентификации. Необходимо включить режим сопряжения на мультиварке.")
+                    raise AuthError("Ошибка аутентификации")
+                _LOGGER.debug("✅ Аутентификация успешна")
+            if self._version_check_due():
+                sw_version = await self.get_version()
+                if self._session.get("sw_version") not in (None, sw_version):
+                    # Прошивка обновилась: возможности устройства нужно определить заново
+                    self._session.pop("pipelined_auth", None)
+                self._sw_version = sw_version
+                self._update_session(sw_version=sw_version, version_checked=self._clock.time())
+                _LOGGER.debug(f"📋 Версия ПО: {self._sw_version}")
+
+    def _device_source(self, device: Any) -> str:
+        """Адаптер или прокси, через который HA слышит устройство (ключ бюджета соединений)."""
+        details = getattr(device, "details", None)
+        source = details.get("source") if isinstance(details, dict) else None
+        return source or self._adapter or ""
+
+    async def _acquire_lease(self, key: str) -> None:
+        """Получение слота соединения из общего бюджета (действия пользователя - вне очереди опросов)."""
+        if self._budget is None or self._lease_key is not None:
+            return
+        try:
+            await self._clock.wait_for(
+                self._budget.acquire(key, self._mac_address, self._link.current_priority, self._on_lease_wanted),
+                CONNECTION_LEASE_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            raise IOError("Нет свободного слота соединения")
+        self._lease_key = key
+
+    def _release_lease(self) -> None:
+        """Возврат слота соединения в общий бюджет."""
+        if self._lease_key is not None:
+            key, self._lease_key = self._lease_key, None
+            self._budget.release(key, self._mac_address)
+
+    def _on_lease_wanted(self) -> bool:
+        """Слот нужен другой мультиварке: простаивающее соединение закрывается, не дожидаясь окна удержания."""
+        if self._linger_handle is None:
+            return False
+        self._cancel_linger()
+        self._on_linger_expired()
+        return True
 
     async def _disconnect_if_need(self) -> None:
-        """Отключение при необходимости (если не постоянное соединение)."""
-        if not self._persistent:
-            await self.disconnect()
+        """Отключение при необходимости (если не постоянное соединение).
+
+        При ненулевом окне удержания соединение закрывается не сразу, а после
+        linger секунд без активности.
+        """
+        if self._persistent:
+            return
+        if self._linger > 0 and self.connected and not (
+                self._lease_key is not None and self._budget.has_waiters(self._lease_key)):
+            self._arm_linger()
+            return
+        await self.disconnect()
+
+    def _arm_linger(self) -> None:
+        """(Пере)запуск таймера закрытия простаивающего соединения."""
+        self._cancel_linger()
+        self._linger_handle = self._clock.call_later(self._linger, self._on_linger_expired)
+
+    def _cancel_linger(self) -> None:
+        """Отмена таймера закрытия простаивающего соединения."""
+        if self._linger_handle:
+            self._linger_handle.cancel()
+            self._linger_handle = None
+
+    def _on_linger_expired(self) -> None:
+        """Окно удержания истекло: закрытие соединения ставится в очередь задачи соединения."""
+        self._linger_handle = None
+        self._linger_task = asyncio.ensure_future(self._link.run(self._close_idle, PRIORITY_POLL))
+
+    async def _close_idle(self) -> None:
+        """Закрытие соединения, если за время ожидания в очереди его снова не использовали."""
+        if self._linger_handle is not None or self._persistent or self._disposed:
+            return
+        _LOGGER.debug(f"🔌 Соединение простаивало {self._linger} с, отключаемся")
+        await self.disconnect()
+
+    def touch(self) -> None:
+        """Отметка активности пользователя: продлевает окно удержания открытого соединения."""
+        if self._linger_handle is not None:
+            self._arm_linger()
 
     def add_stat(self, value: bool) -> None:
         """Добавление статистики успешных операций."""
@@ -271,13 +632,23 @@ class SkyCookerConnectionManager(SkyCooker):
         """Остановка менеджера соединений."""
         if self._disposed:
             return
+        self._cancel_linger()
+        if self._linger_task and not self._linger_task.done():
+            self._linger_task.cancel()
+        await self._link.stop()
         await self._disconnect()
         self._disposed = True
         _LOGGER.debug("Stopped.")
 
     @property
     def available(self) -> bool:
-        """Доступность устройства."""
+        """Доступность устройства.
+
+        При отслеживании объявлений доступность определяется присутствием в эфире
+        без подключения; иначе - результатом последнего подключения.
+        """
+        if self._advertisements.active:
+            return self.connected or (self._advertisements.present and not self._auth_rejected)
         return self._last_connect_ok and self._last_auth_ok
 
     @property
@@ -306,9 +677,24 @@ class SkyCookerConnectionManager(SkyCooker):
         return self._sw_version if self._sw_version else "0.0"
 
     @property
-    def update_lock(self) -> asyncio.Lock:
-        """Публичное свойство для доступа к блокировке обновления."""
-        return self._update_lock
+    def advertisements(self) -> SkyCookerAdvertisementMonitor:
+        """Присутствие устройства в эфире по объявлениям Bluetooth."""
+        return self._advertisements
+
+    @property
+    def breaker(self) -> SkyCookerCircuitBreaker:
+        """Автомат защиты от попыток подключения к недоступному устройству."""
+        return self._breaker
+
+    @property
+    def clock(self) -> SkyCookerClock:
+        """Источник времени и ожиданий."""
+        return self._clock
+
+    @property
+    def link(self) -> SkyCookerLinkActor:
+        """Задача соединения, выполняющая обмены с устройством по одному."""
+        return self._link
 
     @property
     def hass(self) -> asyncio.Lock:
@@ -373,8 +759,4 @@ class SkyCookerConnectionManager(SkyCooker):
 
 
 class AuthError(Exception):
-    pass
-
-
-class DisposedError(Exception):
     pass
\ No newline at end of file
@@ -1,17 +1,17 @@
 #!/usr/local/bin/python3
 # coding: utf-8
 
-import asyncio
 import logging
 import traceback
-from time import monotonic
-from typing import Any, Optional, Tuple
+from typing import Any, Callable, List, Optional, Set, Tuple
 
-from homeassistant.helpers.dispatcher import async_dispatcher_send
 from .const import *
-from .programs import get_program_constants, find_program_id, \
-    find_program_id_by_const, get_standby_program_name, get_program_name, is_program_supported, get_constant_by_name
-from .status import get_status
+from .programs import get_program_constants, find_program_id, get_program_id_by_const, \
+    get_program_name, is_program_supported
+from .skycooker_cooking_sequence import SkyCookerCookingSequence, CookingStep, STEP_SELECT_PROGRAM, \
+    STEP_SET_MAIN_MODE, STEP_TURN_ON, STEP_RESULT_SKIPPED
+from .skycooker_link_actor import PRIORITY_USER
+from .status import get_status, get_changed_fields
 
 
 def is_mode_supported(hass, program_name: str, model_id: int) -> bool:
@@ -26,8 +26,11 @@ class SkyCookerCookingController:
     
     def __init__(self, connection_manager):
         self.connection_manager = connection_manager
-        # self._target_program_name - название программы на языке, который установлен в системе, не число и не константа!!!!
-        self._target_program_name = self._get_standby_program_name()
+        # Целевая программа хранится как идентификатор и константа; перевод в название - только на уровне сущностей
+        self._standby_program_id = get_program_id_by_const(connection_manager.model_id, PROGRAM_STANDBY)
+        self._target_program_id: Optional[int] = None
+        self._target_program_constant: Optional[str] = None
+        self._set_target_program_id(self._standby_program_id)
         self._auto_warm_enabled = True
         self._target_subprogram_id = None
         self._target_temperature = 100
@@ -36,34 +39,60 @@ class SkyCookerCookingController:
         self._target_additional_hours = 0
         self._target_additional_minutes = 0
         self._status = None
+        self._status_time: Optional[float] = None
+        self._changed_fields = set()
+        self._update_listener: Optional[Callable[[Optional[Set[str]]], None]] = None
         self._last_set_target = 0
+        # Выполняемая последовательность запуска (получает статусы от устройства)
+        self._sequence: Optional[SkyCookerCookingSequence] = None
+
+    def set_update_listener(self, listener: Optional[Callable[[Optional[Set[str]]], None]]) -> None:
+        """Установка обработчика, уведомляющего сущности об изменениях."""
+        self._update_listener = listener
+
+    def _notify_update(self, changed_fields: Optional[Set[str]] = None) -> None:
+        """Уведомление сущностей об изменениях (None - обновить все)."""
+        if self._update_listener:
+            self._update_listener(changed_fields)
 
     async def select_program(self, program_id: int, subprog: int=0):
         """Выбор программы приготовления."""
-        program_name = get_program_name(self.connection_manager.hass, program_id, self.connection_manager.model_id)
-        standby_program_name = self._get_standby_program_name()
-        if program_name != standby_program_name and not self.is_program_supported(program_name):
-            _LOGGER.error(f"❌ Попытка установить неподдерживаемый режим {program_name}")
-            raise ValueError(f"Режим {program_name} не поддерживается устройством")
-        
+        if not self._validate_program_selection(program_id):
+            return
+        _LOGGER.debug(f"📤 Отправка команды SELECT_PROGRAM для режима {program_id}")
+        await self.connection_manager.transaction(
+            lambda: self.connection_manager.select_program(program_id, subprog), PRIORITY_USER
+        )
+        self._apply_program_defaults(program_id)
+
+    def _validate_program_selection(self, program_id: int) -> bool:
+        """Проверка программы перед выбором.
+
+        Возвращает False для режима ожидания (целевые значения сбрасываются, команда не нужна),
+        выбрасывает ValueError для неподдерживаемых программ.
+        """
         model_id = self.connection_manager.model_id
         program_constants = get_program_constants(model_id)
-        if model_id and program_id < len(program_constants):
+        if program_id is None or not 0 <= program_id < len(program_constants) or not program_constants[program_id]:
+            _LOGGER.error(f"❌ Попытка установить неподдерживаемый режим {program_id}")
+            raise ValueError(f"Режим {program_id} не поддерживается устройством")
+        
+        if model_id:
             program_constant = program_constants[program_id]
             if program_constant == PROGRAM_NONE:
                 _LOGGER.error(f"❌ Попытка установить режим PROGRAM_NONE (индекс {program_id})")
-                raise ValueError(f"Режим {program_name} не поддерживается устройством (PROGRAM_NONE)")
+                raise ValueError(f"Режим {program_id} не поддерживается устройством (PROGRAM_NONE)")
             elif program_constant == PROGRAM_STANDBY:
                 self._target_temperature = 100
                 self._target_main_hours = 0
                 self._target_main_minutes = 0
                 self._target_additional_hours = 0
                 self._target_additional_minutes = 0
-                return
-        
-        _LOGGER.debug(f"📤 Отправка команды SELECT_PROGRAM для режима {program_name}")
-        await self.connection_manager.select_program(program_id, subprog)
-        
+                return False
+        return True
+
+    def _apply_program_defaults(self, program_id: int) -> None:
+        """Заполнение незаданных целевых значений данными выбранной программы."""
         model_id = self.connection_manager.model_id
         if model_id and model_id in PROGRAM_DATA and program_id < len(PROGRAM_DATA[model_id]):
             program_data = PROGRAM_DATA[model_id][program_id]
@@ -91,7 +120,7 @@ class SkyCookerCookingController:
                                        target_additional_hours, target_additional_minutes,
                                        auto_warm_flag):
         """Публичный метод для выполнения последовательности приготовления."""
-        await self._execute_cooking_sequence(target_program_id, target_subprogram_id, target_temperature,
+        return await self._execute_cooking_sequence(target_program_id, target_subprogram_id, target_temperature,
                                              target_main_hours, target_main_minutes,
                                              target_additional_hours, target_additional_minutes,
                                              auto_warm_flag)
@@ -100,9 +129,9 @@ class SkyCookerCookingController:
         """Публичный метод для получения параметров отложенного старта."""
         return self._get_delayed_start_parameters()
 
-    def get_program_parameters(self, operation_mode):
+    def get_program_parameters(self, program_id: int):
         """Публичный метод для получения параметров программы."""
-        return self._get_program_parameters(operation_mode)
+        return self._get_program_parameters(program_id)
 
     @property
     def auto_warm_enabled(self):
@@ -114,15 +143,15 @@ class SkyCookerCookingController:
         """Установка состояния автоподогрева."""
         self._auto_warm_enabled = value
 
-    def _get_cooking_parameters(self, target_program_name: str) -> list[Any]:
+    def _get_cooking_parameters(self) -> list[Any]:
         """Получение параметров приготовления на основе целевой программы."""
         model_id = self.connection_manager.model_id
-        target_program_id = find_program_id(self.connection_manager.hass, target_program_name, model_id)
+        target_program_id = self._target_program_id
         target_temperature = self._target_temperature if hasattr(self, '_target_temperature') else 100
         target_main_hours = self._target_main_hours if self._target_main_hours is not None else 0
         target_main_minutes = self._target_main_minutes if self._target_main_minutes is not None else 0
         
-        target_subprogram_id = getattr(self, '_target_subprogram_id', 0)
+        target_subprogram_id = getattr(self, '_target_subprogram_id', 0) or 0
         _LOGGER.debug(f"🎯 Используется подпрограмма {target_subprogram_id}")
         
         if target_temperature is None:
@@ -142,80 +171,125 @@ class SkyCookerCookingController:
     async def _execute_cooking_sequence(self, target_program_id: int, target_subprogram_id: int, target_temperature: int,
                                         target_main_hours: int, target_main_minutes: int,
                                         target_additional_hours: int, target_additional_minutes: int,
-                                        auto_warm_flag: int):
-        """Выполнение последовательности приготовления."""
-        # is_in_standby = self._status and self._get_constant_by_name(self._status.program_name) == PROGRAM_STANDBY
-        is_in_standby = self._get_constant_by_name(self.target_program_name) == PROGRAM_STANDBY
-        current_program_id = self._status.program_id if self._status else None
-        device_is_on = self._status.is_on if self._status else False
-        
-        if is_in_standby:
-            _LOGGER.debug("🔄 Устройство находится в режиме ожидания (MODE_STANDBY статус)")
-            _LOGGER.debug("📤 Отправка команды 09 с выбранным режимом и подпрограммой")
-            await self.select_program(target_program_id, target_subprogram_id)
-            await asyncio.sleep(0.5)
-               
-            _LOGGER.debug("📤 Отправка COMMAND_SET_MAIN_MODE = 0x05 с выбранными параметрами")
-            await self.connection_manager.set_main_program(target_program_id, target_subprogram_id, target_temperature, target_main_hours, target_main_minutes, target_additional_hours, target_additional_minutes, auto_warm_flag)
-            await asyncio.sleep(0.3)
-             
-            _LOGGER.debug("📤 Отправка COMMAND_TURN_ON = 0x03")
-            await self.connection_manager.turn_on()
-        elif current_program_id == target_program_id and device_is_on:
-            _LOGGER.debug(f"🔄 На мультиварке уже выбран режим {target_program_id}, и он совпадает с выбранным в интерфейсе")
-            _LOGGER.debug("📤 Отправка COMMAND_SET_MAIN_MODE = 0x05 с выбранными параметрами")
-            await self.connection_manager.set_main_program(target_program_id, target_subprogram_id, target_temperature, target_main_hours, target_main_minutes, target_additional_hours, target_additional_minutes, auto_warm_flag)
-            await asyncio.sleep(0.3)
-               
-            _LOGGER.debug("📤 Отправка COMMAND_TURN_ON = 0x03")
-            await self.connection_manager.turn_on()
-        elif current_program_id != target_program_id:
-            _LOGGER.debug(f"🔄 На мультиварке уже выбран режим {current_program_id}, и он НЕ совпадает с выбранным в интерфейсе ({target_program_id})")
-            _LOGGER.debug("📤 Отправка команды 09 с выбранным режимом и подпрограммой")
-            await self.select_program(target_program_id, target_subprogram_id)
-            await asyncio.sleep(0.5)
-               
-            _LOGGER.debug("📤 Отправка COMMAND_SET_MAIN_MODE = 0x05 с выбранными параметрами")
-            await self.connection_manager.set_main_program(target_program_id, target_subprogram_id, target_temperature, target_main_hours, target_main_minutes, target_additional_hours, target_additional_minutes, auto_warm_flag)
-            await asyncio.sleep(0.3)
-                  
-            _LOGGER.debug("📤 Отправка COMMAND_TURN_ON = 0x03")
-            await self.connection_manager.turn_on()
-        else:
-            _LOGGER.warning("🔄 Неизвестное состояние устройства, отправляем все команды")
-            await self.select_program(target_program_id, target_subprogram_id)
-            await asyncio.sleep(0.3)
-               
-            await self.connection_manager.set_main_program(target_program_id, target_subprogram_id, target_temperature, target_main_hours, target_main_minutes, target_additional_hours, target_additional_minutes, auto_warm_flag)
-            await asyncio.sleep(0.3)
-               
-            await self.connection_manager.turn_on()
+                                        auto_warm_flag: int) -> bool:
+        """Выполнение последовательности приготовления.
+
+        SELECT_PROGRAM, SET_MAIN_MODE и TURN_ON выполняются машиной состояний:
+        каждый шаг отправляется сразу после подтверждения предыдущего,
+        а уже выполненные на устройстве шаги пропускаются.
+        Возвращает True, если устройству была отправлена хотя бы одна команда.
+        """
+        if not self._validate_program_selection(target_program_id):
+            return False
+        status = await self._get_fresh_status()
+        steps = self._build_cooking_steps(target_program_id, target_subprogram_id, target_temperature,
+                                          target_main_hours, target_main_minutes,
+                                          target_additional_hours, target_additional_minutes, auto_warm_flag)
+        self._sequence = SkyCookerCookingSequence(self.connection_manager, steps)
+        try:
+            results = await self._sequence.run(status)
+        finally:
+            self._sequence = None
+        _LOGGER.debug(f"📋 Результаты шагов запуска: {results}")
+        if results.get(STEP_SELECT_PROGRAM) != STEP_RESULT_SKIPPED:
+            self._apply_program_defaults(target_program_id)
+        if all(result == STEP_RESULT_SKIPPED for result in results.values()):
+            _LOGGER.debug("✅ Устройство уже работает с запрошенными параметрами, команды не отправлялись")
+            return False
+        return True
+
+    async def _apply_confirmed_status(self) -> None:
+        """Применение подтвержденного состояния устройства после команд (чтение после записи)."""
+        try:
+            self.status = await self.connection_manager.read_after_write()
+        except Exception as e:
+            _LOGGER.warning(f"⚠️  Не удалось получить состояние после команды: {e}")
+
+    def _build_cooking_steps(self, target_program_id: int, target_subprogram_id: int, target_temperature: int,
+                             target_main_hours: int, target_main_minutes: int,
+                             target_additional_hours: int, target_additional_minutes: int,
+                             auto_warm_flag: int) -> List[CookingStep]:
+        """Шаги запуска с условиями пропуска и подтверждения по статусу."""
+        def program_selected(status: Status) -> bool:
+            return status.program_id == target_program_id and status.subprogram_id == target_subprogram_id
+
+        def main_mode_set(status: Status) -> bool:
+            return (program_selected(status) and status.target_temperature == target_temperature
+                    and status.target_main_hours == target_main_hours
+                    and status.target_main_minutes == target_main_minutes
+                    and status.target_additional_hours == target_additional_hours
+                    and status.target_additional_minutes == target_additional_minutes
+                    and status.auto_warm == auto_warm_flag)
+
+        def turned_on(status: Status) -> bool:
+            return program_selected(status) and status.status in [STATUS_DELAYED_LAUNCH, STATUS_WARMING, STATUS_COOKING]
+
+        # Во время работы target_additional_* содержат остаток обратного отсчета,
+        # поэтому запущенная программа сравнивается без них
+        running_statuses = [STATUS_WARMING, STATUS_COOKING]
+        if target_additional_hours or target_additional_minutes:
+            running_statuses.append(STATUS_DELAYED_LAUNCH)
+
+        def running_as_requested(status: Status) -> bool:
+            return (program_selected(status) and status.status in running_statuses
+                    and status.target_temperature == target_temperature
+                    and status.target_main_hours == target_main_hours
+                    and status.target_main_minutes == target_main_minutes
+                    and status.auto_warm == auto_warm_flag)
+
+        def main_mode_loaded(status: Status) -> bool:
+            return (status.status == STATUS_WAIT and main_mode_set(status)) or running_as_requested(status)
+
+        return [
+            CookingStep(
+                STEP_SELECT_PROGRAM,
+                self.connection_manager.select_program_request(target_program_id, target_subprogram_id),
+                self.connection_manager.check_select_program_response,
+                # Выбор не нужен, если эта программа уже выбрана на включенном устройстве
+                lambda status: (status.is_on and program_selected(status)) or main_mode_loaded(status),
+                program_selected,
+            ),
+            CookingStep(
+                STEP_SET_MAIN_MODE,
+                self.connection_manager.set_main_program_request(
+                    target_program_id, target_subprogram_id, target_temperature, target_main_hours, target_main_minutes,
+                    target_additional_hours, target_additional_minutes, auto_warm_flag
+                ),
+                self.connection_manager.check_set_main_program_response,
+                main_mode_loaded,
+                main_mode_set,
+            ),
+            CookingStep(
+                STEP_TURN_ON,
+                (COMMAND_TURN_ON, []),
+                self.connection_manager.check_turn_on_response,
+                running_as_requested,
+                turned_on,
+            ),
+        ]
     
     async def start(self):
         """Запуск приготовления с текущими настройками."""
-
-        if not self.connection_manager.connected:
-            _LOGGER.error("❌ Устройство не подключено. Пожалуйста, проверьте соединение и повторите попытку.")
-            raise SkyCookerError("Устройство не подключено")
-        if self._target_program_name == self._get_standby_program_name():
+        if self._target_program_id is None or self._target_program_id == self._standby_program_id:
             return
         auto_warm_flag = self._get_auto_warm_flag()
-        [target_program_id, target_subprogram_id, target_temp, target_main_hours, target_main_minutes] = self._get_cooking_parameters(self._target_program_name) # Строка с НАЗВАНИЕМ!!!!)
+        [target_program_id, target_subprogram_id, target_temp, target_main_hours, target_main_minutes] = self._get_cooking_parameters()
+
+        async def start_job():
+            if await self._execute_cooking_sequence(target_program_id, target_subprogram_id, target_temp,
+                                                    target_main_hours, target_main_minutes,
+                                                    0, 0, auto_warm_flag):
+                await self._apply_confirmed_status()
+
         try:
-            await self.connection_manager.connect_if_need()
-            await self._execute_cooking_sequence(target_program_id, target_subprogram_id, target_temp,
-                                                 target_main_hours, target_main_minutes,
-                                                 0, 0, auto_warm_flag)
-            # self._status = await get_status(self.connection_manager)
-            if self.connection_manager.hass:
-                async_dispatcher_send(self.connection_manager.hass, DISPATCHER_UPDATE)
+            # Подключение, команды запуска и отключение - одна транзакция раньше ожидающих опросов
+            await self.connection_manager.transaction(start_job, PRIORITY_USER)
         except Exception as ex:
             _LOGGER.error(f"❌ Ошибка при запуске приготовления: {str(ex)}")
             if "Некорректный размер данных статуса" in str(ex):
                 _LOGGER.error("💡 Проверьте соединение с устройством и повторите попытку")
             raise
-        finally:
-            await self.connection_manager.disconnect_if_need()
+        self._notify_update(self.pop_changed_fields() | {UPDATE_FIELD_TARGETS})
     
     async def enable_auto_warm(self) -> None:
         """Включение режима автоподогрева."""
@@ -227,17 +301,22 @@ class SkyCookerCookingController:
     
     async def stop_cooking(self) -> None:
         """Остановка приготовления."""
-        await self.connection_manager.turn_off()
+        async def stop_job():
+            status = await self._get_fresh_status(required=False)
+            if status is not None and not status.is_on:
+                _LOGGER.debug("✅ Мультиварка уже выключена, команда выключения не отправляется")
+            else:
+                await self.connection_manager.turn_off()
+                await self._apply_confirmed_status()
+
+        await self.connection_manager.transaction(stop_job, PRIORITY_USER)
         
         # Сбрасываем все целевые значения к значениям по умолчанию
-        await self.set_target_program(self._get_standby_program_name())
-        _LOGGER.debug(f"target_program_name: {self._target_program_name}, target_temperature: {self._target_temperature}, target_main_hours: {self._target_main_hours}, "
+        await self.set_target_program_id(self._standby_program_id)
+        _LOGGER.debug(f"target_program_id: {self._target_program_id}, target_temperature: {self._target_temperature}, target_main_hours: {self._target_main_hours}, "
                       f"target_main_minutes: {self._target_main_minutes}, target_additional_hours: {self._target_additional_hours}, target_additional_minutes: {self._target_additional_minutes}"
-                      f"auto_warm: {self._auto_warm_enabled}, target_program_name: {self._target_program_name}")
-        if self.connection_manager.hass:
-            async_dispatcher_send(self.connection_manager.hass, DISPATCHER_UPDATE)
-
-        # self._status = await get_status(self.connection_manager)
+                      f"auto_warm: {self._auto_warm_enabled}, target_program_constant: {self._target_program_constant}")
+        self._notify_update(self.pop_changed_fields() | {UPDATE_FIELD_TARGETS})
     
     def _get_delayed_start_parameters(self) -> Tuple[int, int]:
         """Получение параметров отложенного старта."""
@@ -258,75 +337,78 @@ class SkyCookerCookingController:
         """Запуск приготовления с отложенным стартом."""
         _LOGGER.debug("Starting cooking with delayed start")
 
-        if not self.connection_manager.connected:
-            _LOGGER.error("❌ Устройство не подключено. Пожалуйста, проверьте соединение и повторите попытку.")
-            raise SkyCookerError("Устройство не подключено")
-
-        if self._target_program_name == self._get_standby_program_name():
+        if self._target_program_id is None or self._target_program_id == self._standby_program_id:
             return
-        target_program_id, target_subprogram_id, target_temp, target_main_hours, target_main_minutes = self._get_cooking_parameters(self._target_program_name)
+        target_program_id, target_subprogram_id, target_temp, target_main_hours, target_main_minutes = self._get_cooking_parameters()
         target_additional_hours, target_additional_minutes = self._get_delayed_start_parameters()
         auto_warm_flag = self._get_auto_warm_flag()
+
+        async def start_delayed_job():
+            if await self._execute_cooking_sequence(target_program_id, target_subprogram_id, target_temp,
+                                                    target_main_hours, target_main_minutes,
+                                                    target_additional_hours, target_additional_minutes,
+                                                    auto_warm_flag):
+                await self._apply_confirmed_status()
+
         try:
-            await self.connection_manager.connect_if_need()
-
-            await self._execute_cooking_sequence(target_program_id, target_subprogram_id, target_temp,
-                                                 target_main_hours, target_main_minutes,
-                                                 target_additional_hours, target_additional_minutes,
-                                                 auto_warm_flag)
-            # self._status = await get_status(self.connection_manager)
-            if self.connection_manager.hass:
-                async_dispatcher_send(self.connection_manager.hass, DISPATCHER_UPDATE)
+            await self.connection_manager.transaction(start_delayed_job, PRIORITY_USER)
         except Exception as ex:
             _LOGGER.error(f"❌ Ошибка при настройке отложенного старта: {str(ex)}")
             raise
-        finally:
-            await self.connection_manager.disconnect_if_need()
+        self._notify_update(self.pop_changed_fields() | {UPDATE_FIELD_TARGETS})
 
     async def set_target_temp(self, target_temp: int) -> None:
         """Установка целевой температуры."""
         if target_temp == self.target_temperature:
             return
         self._target_temperature = target_temp
-        self._last_set_target = monotonic()
+        self._last_set_target = self.connection_manager.clock.monotonic()
 
     def _get_auto_warm_flag(self) -> int:
         return 1 if getattr(self, '_auto_warm_enabled', False) else 0
 
-    def _get_standby_program_name(self):
-        return get_standby_program_name(self.connection_manager.hass, self.connection_manager.model_id)
-
-    def _get_constant_by_name(self, program_name: str) -> Optional[str]:
-        return get_constant_by_name(self.connection_manager.hass, program_name, self.connection_manager.model_id)
-
-    def _get_program_parameters(self, program_name: str) -> Tuple[int, int, int]:
+    def _get_program_parameters(self, program_id: Optional[int]) -> Tuple[int, int, int]:
         """Получение параметров режима."""
         model_id = self.connection_manager.model_id
-        program_const = self._get_constant_by_name(program_name)
         target_temperature = 90
         target_main_hours = 0
         target_main_minutes = 0
-        if program_const == PROGRAM_STANDBY: # Режим ожидания
+        if program_id == self._standby_program_id: # Режим ожидания
             target_temperature = 100
             target_main_hours = 0
             target_main_minutes = 0
 
             return target_temperature, target_main_hours, target_main_minutes
-        program_id = find_program_id_by_const(self.connection_manager.hass, program_name, self.connection_manager.model_id)
-        if model_id and model_id in PROGRAM_DATA and program_id == PROGRAM_NAMES[model_id].index(program_const):
+        if model_id and model_id in PROGRAM_DATA and program_id is not None and program_id < len(PROGRAM_DATA[model_id]):
             program_data = PROGRAM_DATA[model_id][program_id]
             target_temperature = program_data["temperature"]
             target_main_hours = program_data["hours"]
             target_main_minutes = program_data["minutes"]
 
         return target_temperature, target_main_hours, target_main_minutes
-    
+
+    def _set_target_program_id(self, program_id: Optional[int]) -> None:
+        """Установка идентификатора и константы целевой программы."""
+        program_constants = get_program_constants(self.connection_manager.model_id)
+        self._target_program_id = program_id
+        if program_id is not None and 0 <= program_id < len(program_constants):
+            self._target_program_constant = program_constants[program_id]
+        else:
+            self._target_program_constant = None
+
     async def set_target_program(self, program_name: str) -> None:
+        """Установка целевой программы по отображаемому названию."""
+        program_id = find_program_id(self.connection_manager.hass, program_name, self.connection_manager.model_id)
+        if program_id is None:
+            _LOGGER.error(f"❌ Программа {program_name} не поддерживается устройством")
+            return
+        await self.set_target_program_id(program_id)
+
+    async def set_target_program_id(self, program_id: int) -> None:
         """Установка целевой программы."""
-        if program_name == self._target_program_name: return
-        program_const = self._get_constant_by_name(program_name)
-        if program_const == PROGRAM_STANDBY:
-            self._target_program_name = self._get_standby_program_name()
+        if program_id == self._target_program_id: return
+        if program_id == self._standby_program_id:
+            self._set_target_program_id(self._standby_program_id)
             self._target_temperature = 100
             self._target_main_hours = 0
             self._target_main_minutes = 0
@@ -334,20 +416,21 @@ class SkyCookerCookingController:
             self._target_additional_minutes = 0
             self._auto_warm_enabled = True
             return
-        if not self.is_program_supported(program_name):
-            _LOGGER.error(f"❌ Программа {program_name} не поддерживается устройством")
+        program_constants = get_program_constants(self.connection_manager.model_id)
+        if program_id is None or not 0 <= program_id < len(program_constants) or program_constants[program_id] in (None, PROGRAM_NONE):
+            _LOGGER.error(f"❌ Программа {program_id} не поддерживается устройством")
             return
 
-        target_temperature, target_main_hours, target_main_minutes = self._get_program_parameters(program_name)
+        target_temperature, target_main_hours, target_main_minutes = self._get_program_parameters(program_id)
 
         if getattr(self, '_target_additional_hours', None) is None:
             self._target_additional_hours = 0
         if getattr(self, '_target_additional_minutes', None) is None:
             self._target_additional_minutes = 0
 
-        self._target_program_name = program_name
+        self._set_target_program_id(program_id)
         self._target_temperature = target_temperature
-        self._last_set_target = monotonic()
+        self._last_set_target = self.connection_manager.clock.monotonic()
 
         self._target_main_hours = target_main_hours
         self._target_main_minutes = target_main_minutes
@@ -380,20 +463,42 @@ class SkyCookerCookingController:
                 return 25
         return None
     
+    @property
+    def target_program_id(self):
+        """Идентификатор целевой программы."""
+        return self._target_program_id
+
+    @target_program_id.setter
+    def target_program_id(self, value):
+        """Установка идентификатора целевой программы."""
+        self._set_target_program_id(value)
+
+    @property
+    def standby_program_id(self):
+        """Идентификатор программы ожидания для модели."""
+        return self._standby_program_id
+
+    @property
+    def target_program_constant(self):
+        """Константа целевой программы."""
+        return self._target_program_constant
+
     @property
     def target_program_name(self):
-        """Целевая программа."""
-        if hasattr(self, '_target_program_name') and self._target_program_name is not None:
-            return self._target_program_name
-        else:
-            if self._status and self._status.is_on:
-                return self._status.program_name
+        """Название целевой программы на языке системы (перевод только для сущностей)."""
+        if self._target_program_id is not None:
+            return get_program_name(self.connection_manager.hass, self._target_program_id, self.connection_manager.model_id)
+        if self._status and self._status.is_on:
+            return self._status.program_name
         return None
 
     @target_program_name.setter
     def target_program_name(self, value):
-        """Установка целевой программы."""
-        self._target_program_name = value
+        """Установка целевой программы по названию."""
+        if value is None:
+            self._set_target_program_id(None)
+            return
+        self._set_target_program_id(find_program_id(self.connection_manager.hass, value, self.connection_manager.model_id))
     
     @property
     def target_main_hours(self):
@@ -469,6 +574,31 @@ class SkyCookerCookingController:
         """Установка целевой температуры."""
         self._target_temperature = value
     
+    async def _get_fresh_status(self, required: bool = True) -> Optional[Status]:
+        """Снимок статуса не старше STATUS_SNAPSHOT_MAX_AGE, при необходимости перечитывается.
+
+        Если статус не удалось перечитать, возвращает None (required=False)
+        или выбрасывает исключение.
+        """
+        if self._status is not None and self.status_age <= STATUS_SNAPSHOT_MAX_AGE:
+            return self._status
+        _LOGGER.debug("🔄 Статус устарел, перечитываем перед отправкой команд")
+        try:
+            self.status = await get_status(self.connection_manager)
+        except Exception as e:
+            if required:
+                raise
+            _LOGGER.debug(f"💡 Не удалось перечитать статус: {e}")
+            return None
+        return self._status
+
+    @property
+    def status_age(self) -> float:
+        """Сколько секунд прошло с получения текущего статуса."""
+        if self._status_time is None:
+            return float("inf")
+        return self.connection_manager.clock.monotonic() - self._status_time
+
     @property
     def status(self):
         """Текущий статус."""
@@ -476,8 +606,21 @@ class SkyCookerCookingController:
 
     @status.setter
     def status(self, value):
-        """Установка текущего статуса."""
+        """Установка текущего статуса с учетом изменившихся полей."""
+        self._changed_fields |= get_changed_fields(self._status, value)
         self._status = value
+        self._status_time = self.connection_manager.clock.monotonic() if value is not None else None
+        if self._sequence:
+            self._sequence.on_status(value)
+
+    def mark_changed(self, fields: Set[str]) -> None:
+        """Пометка полей измененными для следующей публикации обновления."""
+        self._changed_fields |= fields
+
+    def pop_changed_fields(self) -> Set[str]:
+        """Возвращает и сбрасывает поля статуса, изменившиеся с прошлого вызова."""
+        changed, self._changed_fields = self._changed_fields, set()
+        return changed
 
     @property
     def current_program_id(self):
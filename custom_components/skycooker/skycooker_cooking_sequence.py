@@ -0,0 +1,107 @@
+#!/usr/local/bin/python3
+# coding: utf-8
+
+import asyncio
+import logging
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from .const import *
+
+_LOGGER = logging.getLogger(__name__)
+
+# Шаги последовательности запуска
+STEP_SELECT_PROGRAM = "select_program"
+STEP_SET_MAIN_MODE = "set_main_mode"
+STEP_TURN_ON = "turn_on"
+
+# Состояния последовательности (во время выполнения состояние - имя текущего шага)
+SEQUENCE_IDLE = "idle"
+SEQUENCE_DONE = "done"
+SEQUENCE_FAILED = "failed"
+
+# Результаты шагов
+STEP_RESULT_SKIPPED = "skipped"
+STEP_RESULT_ACKED = "acked"
+STEP_RESULT_CONFIRMED = "confirmed"
+
+
+class CookingStep(NamedTuple):
+    """Шаг последовательности запуска."""
+    name: str
+    request: Tuple[int, List[int]]
+    # Проверка ответа устройства (выбрасывает исключение при отказе)
+    check: Callable[[bytes], None]
+    # Статус, при котором шаг не нужен и пропускается
+    is_satisfied: Callable[[Status], bool]
+    # Статус, подтверждающий выполнение отправленного шага раньше ответа
+    is_confirmed: Callable[[Status], bool]
+
+
+def _consume_result(future: asyncio.Future) -> None:
+    """Забирает результат ответа, пришедшего после подтверждения статусом."""
+    if not future.cancelled() and future.exception():
+        _LOGGER.debug(f"💡 Ответ на уже подтвержденный шаг завершился ошибкой: {future.exception()}")
+
+
+class SkyCookerCookingSequence:
+    """Машина состояний запуска приготовления.
+
+    Шаги выполняются по одному: следующая команда отправляется, как только
+    устройство подтвердило предыдущую ответом или прислало статус, в котором
+    шаг уже применен. Шаги, которые текущий статус уже удовлетворяет, пропускаются.
+    """
+
+    def __init__(self, connection_manager, steps: List[CookingStep]) -> None:
+        self.connection_manager = connection_manager
+        self._steps = steps
+        self.state = SEQUENCE_IDLE
+        self.results: Dict[str, str] = {}
+        self._current: Optional[CookingStep] = None
+        self._status_waiter: Optional[asyncio.Future] = None
+
+    def on_status(self, status: Optional[Status]) -> None:
+        """Обработка нового статуса: подтверждает текущий шаг, если он уже применен."""
+        if status is None or self._current is None or self._status_waiter is None:
+            return
+        if not self._status_waiter.done() and self._current.is_confirmed(status):
+            _LOGGER.debug(f"📊 Шаг {self._current.name} подтвержден статусом устройства")
+            self._status_waiter.set_result(status)
+
+    async def run(self, status: Optional[Status]) -> Dict[str, str]:
+        """Выполнение шагов. Возвращает результат каждого шага."""
+        try:
+            for step in self._steps:
+                if status is not None and step.is_satisfied(status):
+                    _LOGGER.debug(f"⏭️  Шаг {step.name} уже выполнен на устройстве, пропускаем")
+                    self.results[step.name] = STEP_RESULT_SKIPPED
+                    continue
+                self.state = step.name
+                self.results[step.name] = await self._run_step(step)
+        except Exception:
+            self.state = SEQUENCE_FAILED
+            raise
+        self.state = SEQUENCE_DONE
+        return self.results
+
+    async def _run_step(self, step: CookingStep) -> str:
+        """Отправка команды шага и ожидание ответа или подтверждающего статуса."""
+        command, params = step.request
+        self._current = step
+        self._status_waiter = asyncio.get_running_loop().create_future()
+        response = asyncio.ensure_future(self.connection_manager.command(command, params))
+        try:
+            await asyncio.wait([response, self._status_waiter], return_when=asyncio.FIRST_COMPLETED)
+        except BaseException:
+            response.cancel()
+            raise
+        finally:
+            self._current = None
+            self._status_waiter.cancel()
+            self._status_waiter = None
+        if response.done():
+            step.check(response.result())
+            _LOGGER.debug(f"✅ Шаг {step.name} подтвержден ответом")
+            return STEP_RESULT_ACKED
+        # Статус пришел раньше ответа: ответ дочитывается в фоне
+        response.add_done_callback(_consume_result)
+        return STEP_RESULT_CONFIRMED
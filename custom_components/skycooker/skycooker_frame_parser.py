@@ -0,0 +1,113 @@
+#!/usr/local/bin/python3
+# coding: utf-8
+
+import logging
+from typing import List
+
+from .const import *
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SkyCookerFrameParser:
+    """Потоковый сборщик кадров 0x55 … 0xAA из BLE уведомлений.
+
+    Уведомления могут приходить разбитыми на части (маленький MTU, ESPHome прокси)
+    или склеенными по несколько кадров. Байты накапливаются в кольцевом буфере
+    фиксированного размера, а полные кадры возвращаются по мере поступления.
+    В кадре нет поля длины, поэтому концом кадра считается байт 0xAA, за которым
+    следует начало следующего кадра, либо 0xAA в конце принятых данных, если
+    кадр уже не короче минимальной длины ответа для своего кода команды.
+    """
+
+    def __init__(self, capacity: int = FRAME_BUFFER_SIZE) -> None:
+        self._capacity = capacity
+        self._buffer = bytearray(capacity)
+        self._head = 0
+        self._size = 0
+
+    def reset(self) -> None:
+        """Сброс накопленных данных (например, при переподключении)."""
+        self._head = 0
+        self._size = 0
+
+    def feed(self, data: bytes) -> List[bytes]:
+        """Добавление данных уведомления. Возвращает список полных кадров."""
+        for byte in data:
+            if self._size == self._capacity:
+                # Буфер переполнен мусором: теряем самый старый байт
+                self._head = (self._head + 1) % self._capacity
+                self._size -= 1
+            self._buffer[(self._head + self._size) % self._capacity] = byte
+            self._size += 1
+
+        frames = []
+        while self._size:
+            pending = self._peek()
+            start = pending.find(FRAME_START)
+            if start < 0:
+                _LOGGER.debug(f"🗑️  Отброшены байты вне кадра: {pending.hex().upper()}")
+                self._consume(len(pending))
+                break
+            if start > 0:
+                _LOGGER.debug(f"🗑️  Отброшены байты до начала кадра: {pending[:start].hex().upper()}")
+                self._consume(start)
+                pending = pending[start:]
+            end = self._find_frame_end(pending)
+            if end is None:
+                if len(pending) > MAX_FRAME_SIZE:
+                    # Начало кадра ложное или хвост потерян: ищем следующий 0x55
+                    _LOGGER.debug(f"🗑️  Не удалось собрать кадр, ресинхронизация: {pending.hex().upper()}")
+                    self._consume(1)
+                    continue
+                break
+            frames.append(pending[:end + 1])
+            self._consume(end + 1)
+        return frames
+
+    @property
+    def has_partial_frame(self) -> bool:
+        """Есть ли в буфере начатый, но не собранный кадр."""
+        return self._size > 0
+
+    def flush(self) -> List[bytes]:
+        """Принудительная выдача накопленного кадра, если он выглядит завершенным.
+
+        Вызывается, когда после фрагмента долго нет новых данных: короткий ответ
+        с неожиданным кодом команды иначе ждал бы следующего уведомления.
+        """
+        pending = self._peek()
+        self.reset()
+        if len(pending) >= 4 and pending[0] == FRAME_START and pending[-1] == FRAME_END:
+            return [pending]
+        if pending:
+            _LOGGER.debug(f"🗑️  Отброшен незавершенный кадр: {pending.hex().upper()}")
+        return []
+
+    @staticmethod
+    def _find_frame_end(pending: bytes):
+        """Поиск индекса завершающего 0xAA для кадра в начале буфера."""
+        if len(pending) < 4:
+            return None
+        min_end = 3 + RESPONSE_MIN_PAYLOAD.get(pending[2], 0)
+        index = pending.find(FRAME_END, 3)
+        while index >= 0:
+            # Байты AA 55 внутри данных короче минимальной длины ответа не завершают кадр
+            if index >= min_end and index + 1 < len(pending) and pending[index + 1] == FRAME_START:
+                return index
+            if index + 1 == len(pending) and index >= min_end:
+                return index
+            index = pending.find(FRAME_END, index + 1)
+        return None
+
+    def _peek(self) -> bytes:
+        """Непрерывная копия накопленных данных."""
+        end = self._head + self._size
+        if end <= self._capacity:
+            return bytes(self._buffer[self._head:end])
+        return bytes(self._buffer[self._head:]) + bytes(self._buffer[:end - self._capacity])
+
+    def _consume(self, count: int) -> None:
+        """Удаление обработанных байтов из начала буфера."""
+        self._head = (self._head + count) % self._capacity
+        self._size -= count
@@ -0,0 +1,133 @@
+#!/usr/local/bin/python3
+# coding: utf-8
+
+import asyncio
+import itertools
+import logging
+from typing import Any, Awaitable, Callable, NamedTuple, Optional, Tuple
+
+from .const import *
+
+_LOGGER = logging.getLogger(__name__)
+
+# Приоритеты запросов (меньше - раньше)
+PRIORITY_USER = 0
+PRIORITY_POLL = 1
+
+# Типы запросов
+REQUEST_ACTION = "action"
+REQUEST_STATUS = "status"
+
+
+class LinkRequest(NamedTuple):
+    """Запрос в почтовом ящике задачи соединения."""
+    kind: str
+    action: Callable[[], Awaitable[Any]]
+    future: asyncio.Future
+
+
+class SkyCookerLinkActor:
+    """Единственная задача устройства, работающая с BLE соединением.
+
+    Все обмены с мультиваркой (опрос, запуск, остановка) ставятся в почтовый ящик
+    и выполняются этой задачей строго по одному, поэтому команды разных вызывающих
+    не перемешиваются и не ломают сопоставление ответов по идентификатору.
+    Действия пользователя выполняются раньше ожидающих опросов, а повторные
+    запросы статуса объединяются с уже стоящим в очереди.
+    """
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._queue: "asyncio.PriorityQueue[Tuple[int, int, LinkRequest]]" = asyncio.PriorityQueue()
+        self._counter = itertools.count()
+        self._task: Optional[asyncio.Task] = None
+        self._queued_status: Optional[LinkRequest] = None
+        self._current_priority = PRIORITY_POLL
+        self._stopped = False
+
+    @property
+    def current_priority(self) -> int:
+        """Приоритет выполняемого запроса."""
+        return self._current_priority
+
+    async def run(self, action: Callable[[], Awaitable[Any]], priority: int = PRIORITY_USER) -> Any:
+        """Выполнение действия задачей соединения и ожидание его результата."""
+        if self._in_actor():
+            return await action()
+        return await self._submit(REQUEST_ACTION, action, priority)
+
+    async def request_status(self, action: Callable[[], Awaitable[Any]], priority: int = PRIORITY_POLL) -> Any:
+        """Запрос статуса; объединяется с запросом статуса, еще ожидающим в очереди."""
+        if self._in_actor():
+            return await action()
+        if self._queued_status is not None and not self._queued_status.future.done():
+            _LOGGER.debug("🔗 Запрос статуса объединен с ожидающим в очереди")
+            return await asyncio.shield(self._queued_status.future)
+        return await self._submit(REQUEST_STATUS, action, priority)
+
+    async def _submit(self, kind: str, action: Callable[[], Awaitable[Any]], priority: int) -> Any:
+        """Постановка запроса в почтовый ящик."""
+        if self._stopped:
+            raise DisposedError()
+        request = LinkRequest(kind, action, asyncio.get_running_loop().create_future())
+        if kind == REQUEST_STATUS:
+            self._queued_status = request
+        self._queue.put_nowait((priority, next(self._counter), request))
+        self._ensure_task()
+        if kind == REQUEST_STATUS:
+            # Результат общий для объединенных запросов: отмена одного из них не отменяет остальные
+            return await asyncio.shield(request.future)
+        return await request.future
+
+    def _in_actor(self) -> bool:
+        """Вызов из самой задачи соединения (вложенный запрос выполняется сразу)."""
+        return self._task is not None and asyncio.current_task() is self._task
+
+    def _ensure_task(self) -> None:
+        """Запуск задачи соединения при первом запросе."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._loop(), name=f"skycooker_link_{self._name}")
+
+    async def _loop(self) -> None:
+        """Обработка почтового ящика."""
+        while True:
+            priority, _, request = await self._queue.get()
+            self._current_priority = priority
+            if request is self._queued_status:
+                # Запросы статуса после этого момента требуют нового чтения
+                self._queued_status = None
+            if request.future.done():
+                self._current_priority = PRIORITY_POLL
+                continue
+            try:
+                result = await request.action()
+            except asyncio.CancelledError:
+                if not request.future.done():
+                    request.future.set_exception(DisposedError())
+                raise
+            except Exception as e:
+                if not request.future.done():
+                    request.future.set_exception(e)
+            else:
+                if not request.future.done():
+                    request.future.set_result(result)
+            finally:
+                # Простаивающая задача соединения не выполняет действий пользователя
+                self._current_priority = PRIORITY_POLL
+
+    async def stop(self) -> None:
+        """Остановка задачи соединения; ожидающие запросы завершаются ошибкой."""
+        self._stopped = True
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        self._queued_status = None
+        while not self._queue.empty():
+            _, _, request = self._queue.get_nowait()
+            if not request.future.done():
+                request.future.set_exception(DisposedError())
+
+
+class DisposedError(Exception):
+    pass
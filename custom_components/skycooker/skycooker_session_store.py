@@ -0,0 +1,62 @@
+#!/usr/local/bin/python3
+# coding: utf-8
+
+import asyncio
+import logging
+from typing import Any, Dict
+
+from homeassistant.helpers.storage import Store
+
+from .const import *
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SkyCookerSessionStore:
+    """Кэш сессий мультиварок по MAC адресу, сохраняемый между перезапусками HA.
+
+    Для каждого устройства хранит модель, версию ПО, время ее последней проверки
+    и то, принимает ли прошивка команды сразу за AUTH, не дожидаясь ответа на нее.
+    """
+
+    def __init__(self, hass) -> None:
+        self._store = Store(hass, SESSION_STORE_VERSION, SESSION_STORE_KEY)
+        self._sessions: Dict[str, Dict[str, Any]] = {}
+        self._load_lock = asyncio.Lock()
+        self._loaded = False
+
+    async def async_load(self) -> None:
+        """Загрузка кэша из хранилища (однократно)."""
+        async with self._load_lock:
+            if self._loaded:
+                return
+            data = await self._store.async_load()
+            self._sessions = dict((data or {}).get("sessions", {}))
+            self._loaded = True
+            _LOGGER.debug(f"📋 Загружен кэш сессий для {len(self._sessions)} устройств")
+
+    def get(self, mac: str) -> Dict[str, Any]:
+        """Копия данных сессии устройства (пустой словарь для незнакомого устройства)."""
+        return dict(self._sessions.get(mac, {}))
+
+    def update(self, mac: str, session: Dict[str, Any]) -> None:
+        """Сохранение данных сессии устройства (запись в хранилище откладывается)."""
+        self._sessions[mac] = dict(session)
+        self._store.async_delay_save(self._data_to_save, SESSION_SAVE_DELAY)
+
+    def remove(self, mac: str) -> None:
+        """Удаление данных сессии устройства."""
+        if self._sessions.pop(mac, None) is not None:
+            self._store.async_delay_save(self._data_to_save, SESSION_SAVE_DELAY)
+
+    def _data_to_save(self) -> Dict[str, Any]:
+        return {"sessions": self._sessions}
+
+
+async def async_get_session_store(hass) -> SkyCookerSessionStore:
+    """Общий для всех входов кэш сессий, загруженный из хранилища."""
+    store = hass.data.get(DATA_SESSION_STORE)
+    if store is None:
+        store = hass.data[DATA_SESSION_STORE] = SkyCookerSessionStore(hass)
+    await store.async_load()
+    return store
@@ -1,13 +1,13 @@
 #!/usr/local/bin/python3
 # coding: utf-8
 
-import asyncio
 import logging
 import traceback
-from time import monotonic
 
 from .const import *
+from .skycooker_circuit_breaker import BREAKER_HALF_OPEN
 from .skycooker_connection_manager import AuthError
+from .skycooker_link_actor import PRIORITY_POLL
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -20,48 +20,87 @@ class SkyCookerStateManager:
         self.cooking_controller = cooking_controller
         self._stats = None
     
-    async def update(self, tries=MAX_TRIES, force_stats=False, extra_action=None, commit=False):
-        """Обновление состояния мультиварки."""
+    async def update(self, tries=MAX_TRIES, force_stats=False, extra_action=None, commit=False,
+                     bypass_breaker=False, started=None):
+        """Обновление состояния мультиварки.
+
+        Автомат защиты учитывает один результат на цикл опроса (со всеми повторами);
+        bypass_breaker отключает его для проверки подключения при настройке.
+        """
+        breaker = self.connection_manager.breaker
+        if started is None:
+            started = self.connection_manager.clock.monotonic()
         try:
-            async with self.connection_manager.update_lock:
-                if self.connection_manager.disposed: return None
-                _LOGGER.debug("🔄 Обновление состояния мультиварки")
-                if not self.connection_manager.available: force_stats = True
-                await self.connection_manager.connect_if_need()
-              
-                if extra_action: await extra_action
-              
-                try:
-                    status = await self.connection_manager.get_status()
-                    self.cooking_controller.status = status
-                except Exception as e:
-                    _LOGGER.warning(f"⚠️  Ошибка получения статуса: {e}")
-                    self.cooking_controller.status = None
-                    raise
-              
-                _LOGGER.debug("📊 Статус устройства успешно получен, команды не отправляются")
-             
-                await self.connection_manager.disconnect_if_need()
-                self.connection_manager.add_stat(True)
-             
-                return True
+            if self.connection_manager.disposed: return None
+            if not bypass_breaker and not breaker.allow_request():
+                retry_in = breaker.retry_in
+                _LOGGER.debug("⛔ Устройство недоступно, опрос пропущен" + (
+                    f" (следующая попытка через {retry_in:.0f} с)" if retry_in is not None else " (идет пробная попытка)"))
+                return False
+            if not self.connection_manager.connected and not self.connection_manager.advertisements.present:
+                _LOGGER.debug("📡 Устройство не слышно в эфире, опрос отложен до его объявления")
+                return False
+            if not self.connection_manager.available: force_stats = True
+            # Обмен выполняет задача соединения; одновременные опросы объединяются в одно чтение
+            link = self.connection_manager.link
+            if extra_action:
+                await link.run(lambda: self._update_once(extra_action), PRIORITY_POLL)
+            else:
+                await link.request_status(self._update_once)
+            return True
     
         except Exception as ex:
-            await self.connection_manager.disconnect()
-            if hasattr(self.cooking_controller, 'target_program_name') and self.cooking_controller.target_program_name is not None and self.cooking_controller.last_set_target + TARGET_TTL < monotonic():
-                _LOGGER.warning(f"⚠️  Не удалось установить режим {self.cooking_controller.target_program_name} в течение {TARGET_TTL} секунд, прекращаю попытки")
-                self.cooking_controller.target_program_name = None
-            if isinstance(ex, AuthError): return None
-            self.connection_manager.add_stat(False)
+            if self.cooking_controller.target_program_id is not None and self.cooking_controller.last_set_target + TARGET_TTL < self.connection_manager.clock.monotonic():
+                _LOGGER.warning(f"⚠️  Не удалось установить режим {self.cooking_controller.target_program_constant} в течение {TARGET_TTL} секунд, прекращаю попытки")
+                self.cooking_controller.target_program_id = None
+                self.cooking_controller.mark_changed({UPDATE_FIELD_TARGETS})
+            if isinstance(ex, AuthError):
+                # Неудачная пробная попытка тоже должна снова разомкнуть автомат
+                if not bypass_breaker: breaker.record_failure(started)
+                return None
+            if not bypass_breaker and breaker.state == BREAKER_HALF_OPEN:
+                # Пробная попытка после паузы автомата - одна, без повторов
+                _LOGGER.debug(f"🚫 Пробная попытка не удалась, {type(ex).__name__}: {str(ex)}")
+                breaker.record_failure(started)
+                return False
             if tries > 1 and extra_action is None:
                 _LOGGER.debug(f"🚫 {type(ex).__name__}: {str(ex)}, повтор #{MAX_TRIES - tries + 1}")
-                await asyncio.sleep(TRIES_INTERVAL)
-                return await self.update(tries=tries-1, force_stats=force_stats, extra_action=extra_action, commit=commit)
+                await self.connection_manager.clock.sleep(TRIES_INTERVAL)
+                return await self.update(tries=tries-1, force_stats=force_stats, extra_action=extra_action, commit=commit,
+                                         bypass_breaker=bypass_breaker, started=started)
             else:
                 _LOGGER.warning(f"⚠️  Не удалось обновить состояние, {type(ex).__name__}: {str(ex)}")
                 _LOGGER.debug(traceback.format_exc())
+                if not bypass_breaker: breaker.record_failure(started)
             return False
     
+    async def _update_once(self, extra_action=None):
+        """Одно чтение статуса; выполняется задачей соединения."""
+        _LOGGER.debug("🔄 Обновление состояния мультиварки")
+        try:
+            await self.connection_manager.connect_if_need()
+
+            if extra_action: await extra_action
+
+            try:
+                status = await self.connection_manager.get_status()
+                self.cooking_controller.status = status
+            except Exception as e:
+                _LOGGER.warning(f"⚠️  Ошибка получения статуса: {e}")
+                self.cooking_controller.status = None
+                raise
+
+            _LOGGER.debug("📊 Статус устройства успешно получен, команды не отправляются")
+
+            await self.connection_manager.disconnect_if_need()
+            self.connection_manager.add_stat(True)
+            self.connection_manager.breaker.record_success()
+        except Exception as ex:
+            # Статистика ведется по обменам: объединенные запросы статуса не дублируют результат
+            if not isinstance(ex, AuthError): self.connection_manager.add_stat(False)
+            await self.connection_manager.disconnect()
+            raise
+
     async def commit(self):
         """Применение изменений к устройству."""
         _LOGGER.debug("Committing changes")
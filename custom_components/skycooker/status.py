@@ -1,6 +1,6 @@
 """Модуль для работы со статусом SkyCooker."""
 
-from typing import Optional, Any
+from typing import Optional, Any, Set
 import logging
 
 from .const import COMMAND_GET_STATUS, STATUS_CODE_TO_TRANSLATION_KEY, Status
@@ -53,6 +53,18 @@ async def get_status(connection_manager) -> Status:
         SkyCookerError: Если данные статуса некорректны или не могут быть разобраны.
     """
     r = await connection_manager.command(COMMAND_GET_STATUS)
+    return parse_status(connection_manager.hass, connection_manager.model_id, r)
+
+
+def parse_status(hass: Any, model_id: int, r: bytes) -> Status:
+    """Разбор данных статуса (ответа на GET_STATUS или уведомления 0x06).
+
+    Returns:
+        Статус в виде именованного кортежа Status.
+
+    Raises:
+        SkyCookerError: Если данные статуса некорректны или не могут быть разобраны.
+    """
     _LOGGER.debug(f"Raw status data: {r.hex().upper()}, length: {len(r)}")
     if len(r) < 16:
         _LOGGER.error(f"❌ Ошибка: получено {len(r)} байт вместо ожидаемых 16")
@@ -72,7 +84,7 @@ async def get_status(connection_manager) -> Status:
         status = r[8]
         is_on = r[8] != 0
         sound_enabled = r[9] != 0
-        program_name = get_program_name(connection_manager.hass, program_id, connection_manager.model_id)
+        program_name = get_program_name(hass, program_id, model_id)
         status_data = Status(
             program_id=program_id,
             subprogram_id=subprogram_id,
@@ -102,3 +114,12 @@ async def get_status(connection_manager) -> Status:
         f"current_status={status_data.status}, program_name={status_data.program_name}, "
     )
     return status_data
+
+
+def get_changed_fields(old: Optional[Status], new: Optional[Status]) -> Set[str]:
+    """Возвращает имена полей Status, значения которых отличаются."""
+    if old is None and new is None:
+        return set()
+    if old is None or new is None:
+        return set(Status._fields)
+    return {field for field, old_value, new_value in zip(Status._fields, old, new) if old_value != new_value}
@@ -22,6 +22,7 @@ class SkyCookerSwitch(SkyCookerEntity, SwitchEntity):
         """Инициализация переключателя."""
         super().__init__(hass, entry)
         self.switch_type = switch_type
+        self.update_fields = frozenset({"auto_warm", UPDATE_FIELD_TARGETS})
 
     @property
     def unique_id(self):
@@ -50,10 +51,10 @@ class SkyCookerSwitch(SkyCookerEntity, SwitchEntity):
         """Включение переключателя."""
         if self.switch_type == SWITCH_TYPE_AUTO_WARM:
             self.skycooker.auto_warm_enabled = True
-            self.update()
+            self._async_handle_update()
 
     async def async_turn_off(self, **kwargs):
         """Выключение переключателя."""
         if self.switch_type == SWITCH_TYPE_AUTO_WARM:
             self.skycooker.auto_warm_enabled = False
-            self.update()
\ No newline at end of file
+            self._async_handle_update()
\ No newline at end of file
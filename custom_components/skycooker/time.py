@@ -7,7 +7,8 @@ from datetime import datetime
 from struct import pack, unpack
 from typing import Any, List, Optional, Tuple
 from .const import COMMAND_SYNC_TIME, COMMAND_GET_TIME, STATUS_DELAYED_LAUNCH, \
-    STATUS_WARMING, STATUS_COOKING, STATUS_AUTO_WARM, Status
+    STATUS_WARMING, STATUS_COOKING, STATUS_AUTO_WARM, STATUS_OFF, STATUS_FULL_OFF, Status, \
+    POLL_INTERVAL_IDLE_FACTOR, POLL_INTERVAL_IDLE_MAX, POLL_INTERVAL_ACTIVE, POLL_INTERVAL_MIN, POLL_TRANSITION_MARGIN
 from .utils import get_localized_string
 
 _LOGGER = logging.getLogger(__name__)
@@ -146,4 +147,34 @@ def get_delayed_launch_time(hass: Any, skycooker: Any, status_code: int) -> str:
         additional_hours = get_time_from_status(skycooker, skycooker.status, 'target_additional_hours')
         additional_minutes = get_time_from_status(skycooker, skycooker.status, 'target_additional_minutes')
         return format_time(hass, additional_hours, additional_minutes)
-    return format_time(hass, 0, 0)
\ No newline at end of file
+    return format_time(hass, 0, 0)
+
+
+def get_countdown_seconds(status: Optional[Status], status_code: Optional[int]) -> Optional[int]:
+    """Возвращает, через сколько секунд ожидается смена статуса по обратному отсчету.
+
+    Для отложенного старта и готовки устройство сообщает оставшееся время
+    в target_additional_*; для остальных статусов смена не прогнозируется.
+    """
+    if not status or status_code not in [STATUS_DELAYED_LAUNCH, STATUS_COOKING]:
+        return None
+    return status.target_additional_hours * 3600 + status.target_additional_minutes * 60
+
+
+def get_poll_interval(status: Optional[Status], status_code: Optional[int], scan_interval: float) -> float:
+    """Возвращает интервал до следующего опроса в зависимости от статуса устройства.
+
+    Выключенное устройство опрашивается реже (но не реже POLL_INTERVAL_IDLE_MAX,
+    если сам scan_interval не больше), разогрев и готовка - чаще,
+    а окончание обратного отсчета будит опрос сразу после ожидаемой смены статуса.
+    """
+    if status_code in [STATUS_OFF, STATUS_FULL_OFF]:
+        interval = max(scan_interval, min(scan_interval * POLL_INTERVAL_IDLE_FACTOR, POLL_INTERVAL_IDLE_MAX))
+    elif status_code in [STATUS_WARMING, STATUS_COOKING]:
+        interval = min(scan_interval, POLL_INTERVAL_ACTIVE)
+    else:
+        interval = scan_interval
+    countdown = get_countdown_seconds(status, status_code)
+    if countdown is not None:
+        interval = min(interval, countdown + POLL_TRANSITION_MARGIN)
+    return max(interval, POLL_INTERVAL_MIN)
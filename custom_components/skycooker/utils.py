@@ -4,7 +4,7 @@ from typing import Any
 from homeassistant.const import CONF_FRIENDLY_NAME
 from homeassistant.core import HomeAssistant
 
-from .const import SKYCOOKER_NAME
+from .const import DISPATCHER_UPDATE, DOMAIN, SKYCOOKER_NAME
 
 
 def get_base_name(entry: Any) -> str:
@@ -12,6 +12,11 @@ def get_base_name(entry: Any) -> str:
     return (SKYCOOKER_NAME + " " + entry.data.get(CONF_FRIENDLY_NAME, "")).strip()
 
 
+def get_dispatcher_signal(entry_id: str) -> str:
+    """Возвращает имя сигнала обновления для сущностей конфигурационного входа."""
+    return f"{DOMAIN}_{DISPATCHER_UPDATE}_{entry_id}"
+
+
 def get_lower_model_name(name: str) -> str:
     """Возвращает имя модели в нижнем регистре с заменой дефисов на подчеркивания."""
     return name.replace("-", "_").lower()